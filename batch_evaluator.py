@@ -0,0 +1,88 @@
+"""Race every car option on every map for several seeds across processes, run from the project root:
+python batch_evaluator.py [--seeds 5] [--laps 3] [--workers 4] [--output results.jsonl]"""
+import os
+
+# Stdout only carries the results
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import itertools
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from core.map_file import MapFile
+from settings import Settings
+
+
+def get_map_names() -> list[str]:
+    """Get the names of the maps in the maps folder, without loading them."""
+    maps_root = Path(__file__).parent / "assets" / "maps"
+    return sorted(
+        {
+            map_file.stem
+            for map_file in maps_root.iterdir()
+            if map_file.suffix in (".json", MapFile.EXTENSION)
+        }
+    )
+
+
+def initialize_worker():
+    """Send the log messages of a worker to stderr, stdout only carries the results."""
+    sys.stdout = sys.stderr
+
+
+def evaluate(car_index: int, map_name: str, seed: int, laps: int) -> dict:
+    """Race a car option against opponents picked by the seed, returns the result of the car option."""
+    # Imported in the worker, the parent process never creates a display
+    import headless
+
+    race = headless.run_race(
+        map_name, [Settings.CAR_OPTIONS[car_index]], laps, seed=seed
+    )
+    result = next(car for car in race["cars"] if car["player"] == 0)
+    return {
+        "car": Settings.CAR_OPTIONS[car_index][0],
+        "map": map_name,
+        "seed": seed,
+        "laps": laps,
+        "ticks": race["ticks"],
+        "finished": result["finished"],
+        "place": result["place"],
+        "finish_time": result["finish_time"],
+        "lap_times": result["lap_times"],
+        "best_lap": min(result["lap_times"], default=None),
+        "penalties": result["penalties"],
+        "collisions": result["collisions"],
+    }
+
+
+def evaluate_all(seeds: int, laps: int, workers: int = None, output=sys.stdout):
+    """Race every car option on every map for every seed, writing a JSON line for each race as soon as it finished."""
+    jobs = itertools.product(
+        range(len(Settings.CAR_OPTIONS)), get_map_names(), range(seeds)
+    )
+
+    with ProcessPoolExecutor(workers, initializer=initialize_worker) as executor:
+        futures = [
+            executor.submit(evaluate, car_index, map_name, seed, laps)
+            for car_index, map_name, seed in jobs
+        ]
+        for future in as_completed(futures):
+            output.write(json.dumps(future.result()) + "\n")
+            output.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=5)
+    parser.add_argument("--laps", type=int, default=Settings.RACE_LAPS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.output is None:
+        evaluate_all(args.seeds, args.laps, args.workers)
+    else:
+        with open(args.output, "w") as output:
+            evaluate_all(args.seeds, args.laps, args.workers, output)
@@ -0,0 +1,56 @@
+"""Run the benchmarks without a display, run from the project root:
+python -m benchmarks [--save] [--compare] [--baseline benchmarks/baseline.json] [--threshold 0.1] [name ...]"""
+import os
+
+# Must be set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import sys
+from pathlib import Path
+from benchmarks.cases import create_benchmarks
+from benchmarks.runner import BenchmarkRunner
+from core.dependency_injection import DI
+from core.services.scene_service import SceneService
+
+
+def main() -> int:
+    """Run the benchmarks, returns 1 when a benchmark regressed compared to the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="only run the benchmarks starting with these names")
+    parser.add_argument("--baseline", type=Path, default=Path(__file__).parent / "baseline.json")
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare the results with the baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown of the median that is a regression")
+    parser.add_argument("--repeat", type=int, default=BenchmarkRunner.REPEAT)
+    args = parser.parse_args()
+
+    scene_service = DI.getInstance().get(SceneService)
+    benchmarks = [
+        benchmark
+        for benchmark in create_benchmarks(scene_service.screen, scene_service.services)
+        if not args.names or benchmark.name.startswith(tuple(args.names))
+    ]
+
+    runner = BenchmarkRunner(args.repeat)
+    results = runner.run_all(benchmarks)
+
+    regressions = []
+    if args.compare:
+        baseline = BenchmarkRunner.load_baseline(args.baseline)
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        for name, ratio, verdict in BenchmarkRunner.compare(results, baseline, args.threshold):
+            print(f"{name:<36} {ratio:>8.2f}x  {verdict}")
+            if verdict == "regression":
+                regressions.append(name)
+
+    if args.save:
+        BenchmarkRunner.save_baseline(args.baseline, results)
+        print(f"\nSaved the baseline to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import itertools
+import math
+from types import SimpleNamespace
+import pygame
+from benchmarks.runner import Benchmark
+from core.camera import Camera
+from core.car import Car
+from core.car_properties import CarProperties
+from core.components.label_component import LabelComponent
+from core.components.statistics_panel import StatisticsPanel
+from core.enums.alignment import Alignment
+from core.enums.sprite_type import SpriteType
+from core.input_state import InputState
+from core.map import Map
+from core.position import Position
+from core.race_rules import RaceRules
+from core.relative import Relative
+from settings import Settings
+from utilities.helper import Helper
+
+MAP_NAME = "map_right"
+COLLISION_CAR_COUNTS = (1, 2, 4, 8, 16, 32)
+ROUTE_SPACING = 30  # world pixels between cars placed along the route, less than a car length so neighbours touch
+RELATIVE_CHAIN_LENGTH = 8
+ROTATIONS = range(0, 360, 7)
+
+
+def get_route_positions(map: Map, amount: int) -> list[tuple[tuple[float, float], float]]:
+    """Get positions and rotations along the route AI cars follow, the checkpoints of a race in order.
+    The positions start at the first checkpoint and are the route spacing apart, so the cars form a crowded pack on the track."""
+    route = [checkpoint.center for checkpoint in RaceRules(map, 1).checkpoints]
+    segments = [(route[index], route[(index + 1) % len(route)]) for index in range(len(route))]
+    route_length = sum(math.dist(start, end) for start, end in segments)
+
+    positions = []
+    for index in range(amount):
+        distance = index * ROUTE_SPACING % route_length
+        for start, end in segments:
+            segment_length = math.dist(start, end)
+            if distance < segment_length:
+                break
+            distance -= segment_length
+
+        progress = distance / segment_length
+        position = (
+            start[0] + (end[0] - start[0]) * progress,
+            start[1] + (end[1] - start[1]) * progress,
+        )
+        rotation = math.degrees(math.atan2(end[0] - start[0], start[1] - end[1]))
+        positions.append((position, rotation))
+    return positions
+
+
+def create_benchmarks(screen: pygame.Surface, services: SimpleNamespace) -> list[Benchmark]:
+    """Create the benchmarks of the hot paths of the engine, using the services of the game."""
+
+    def create_car(index: int) -> Car:
+        color, sprite, properties = Settings.CAR_OPTIONS[index % len(Settings.CAR_OPTIONS)]
+        return Car(
+            f"{color} C-{index}",
+            services.sprite.get_sprite_from(SpriteType.VEHICLE, sprite),
+            Position((0, 0)),
+            CarProperties(*properties),
+            services.font,
+        )
+
+    def setup_position_arithmetic():
+        first = Position((12.5, 40.25))
+        second = Position((3.75, -8.5))
+
+        def position_arithmetic():
+            Position(first + second)
+            Position(first - second)
+            Position(first * 2)
+            first.get_offset_between_pos(second)
+
+        return position_arithmetic
+
+    def setup_relative_chain():
+        position = Position((64, 64))
+        for index in range(RELATIVE_CHAIN_LENGTH):
+            position = Relative(position, (index, index))
+        return position.get_pos
+
+    def setup_sprite(method_name: str):
+        def setup():
+            sprite = create_car(0).sprite
+            rotations = itertools.cycle(ROTATIONS)
+            method = getattr(sprite, method_name)
+
+            def rotated_sprite():
+                sprite.rotation = next(rotations)
+                method()
+
+            return rotated_sprite
+
+        return setup
+
+    def setup_collision(car_count: int):
+        def setup():
+            Settings.PLAYER_TO_PLAYER_COLLISION = True
+            map = services.map.get_map(MAP_NAME)
+            cars = [create_car(index) for index in range(car_count)]
+            for car, (position, rotation) in zip(cars, get_route_positions(map, car_count)):
+                car.set_position(Position(position))
+                car.set_rotation(rotation)
+
+            return lambda: services.collision.detect(map, cars)
+
+        return setup
+
+    def teardown_collision():
+        Settings.PLAYER_TO_PLAYER_COLLISION = player_to_player_collision
+
+    def setup_map_draw(scrolling: bool):
+        def setup():
+            map = services.map.get_map(MAP_NAME)
+            world_rect = map.get_world_rect()
+
+            # A split-screen view is smaller than the world, so the camera pans and chunks are culled
+            viewport = Helper.get_split_viewports(screen.get_rect(), 4)[0]
+            camera = Camera(viewport, world_rect)
+            camera.follow(Position(world_rect.center))
+
+            # An 8x8 grid of camera positions over the world, the calibrated calls are whole rounds of it
+            positions = itertools.cycle(
+                [
+                    (world_rect.width * column // 7, world_rect.height * row // 7)
+                    for row in range(8)
+                    for column in range(8)
+                ]
+            )
+
+            def map_draw():
+                if scrolling:
+                    camera.follow(Position(next(positions)))
+                map.draw(screen, 255, camera)
+
+            return map_draw
+
+        return setup
+
+    def setup_label_draw(changing: bool):
+        def setup():
+            label = LabelComponent(
+                "benchmark_label",
+                Position((200, 200)),
+                "Benchmark",
+                Alignment.CENTER,
+                16,
+                font_service=services.font,
+            )
+            # Every text is new, so each call renders it instead of hitting the render cache
+            texts = (f"{speed} pp/u" for speed in itertools.count())
+
+            def label_draw():
+                if changing:
+                    label.text = next(texts)
+                label.draw(screen)
+
+            return label_draw
+
+        return setup
+
+    def setup_statistics_panel_update():
+        car = create_car(0)
+        panel = StatisticsPanel(
+            "benchmark_statistics_panel",
+            car,
+            Position((Settings.MAP_OFFSET, screen.get_height() - 110)),
+            None,
+            None,
+            services.font,
+        )
+        input_state = InputState()
+        speeds = itertools.cycle(range(100))
+
+        def statistics_panel_update():
+            car.statistics.current.speed = next(speeds)
+            panel.update(1.0 / Settings.TICK_RATE, input_state)
+
+        return statistics_panel_update
+
+    player_to_player_collision = Settings.PLAYER_TO_PLAYER_COLLISION
+    return [
+        Benchmark("position_arithmetic", setup_position_arithmetic),
+        Benchmark(f"relative_chain[{RELATIVE_CHAIN_LENGTH}]", setup_relative_chain),
+        Benchmark("sprite_get_sprite_rotated", setup_sprite("get_sprite")),
+        Benchmark("sprite_get_mask_rotated", setup_sprite("get_mask")),
+        *[
+            Benchmark(
+                f"collision_detect[{car_count}]",
+                setup_collision(car_count),
+                teardown_collision,
+            )
+            for car_count in COLLISION_CAR_COUNTS
+        ],
+        Benchmark("map_draw", setup_map_draw(False)),
+        Benchmark("map_draw_scrolling", setup_map_draw(True)),
+        Benchmark("label_draw", setup_label_draw(False)),
+        Benchmark("label_draw_changing_text", setup_label_draw(True)),
+        Benchmark("statistics_panel_update", setup_statistics_panel_update),
+    ]
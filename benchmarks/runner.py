@@ -0,0 +1,121 @@
+import gc
+import json
+import statistics
+import time
+from pathlib import Path
+
+
+class Benchmark:
+    """A named piece of code to time, the setup is called once and returns the function that is timed."""
+
+    def __init__(self, name: str, setup, teardown=None):
+        self.name = name
+        self.setup = setup
+        self.teardown = teardown
+
+
+class BenchmarkRunner:
+    """Times benchmarks and compares them with a baseline.
+    Every benchmark is called in loops long enough to time reliably, the median of the repeated loops is its result."""
+
+    MIN_LOOP_TIME = 0.02  # seconds a timed loop takes at least
+    REPEAT = 15  # timed loops for every benchmark
+    WARMUP = 2  # untimed loops before timing, filling the caches
+
+    def __init__(self, repeat: int = REPEAT, min_loop_time: float = MIN_LOOP_TIME):
+        self.repeat = repeat
+        self.min_loop_time = min_loop_time
+
+    def run(self, benchmark: Benchmark) -> dict:
+        """Time a benchmark, returns its statistics in microseconds per call."""
+        function = benchmark.setup()
+        try:
+            calls = self.calibrate(function)
+            for _ in range(self.WARMUP):
+                self.time_loop(function, calls)
+
+            samples = [
+                self.time_loop(function, calls) / calls * 1_000_000
+                for _ in range(self.repeat)
+            ]
+        finally:
+            if benchmark.teardown is not None:
+                benchmark.teardown()
+
+        quartiles = statistics.quantiles(samples, n=4)
+        median = statistics.median(samples)
+        return {
+            "calls": calls,
+            "median": median,
+            "min": min(samples),
+            "p25": quartiles[0],
+            "p75": quartiles[2],
+            "spread": (quartiles[2] - quartiles[0]) / median if median else 0.0,
+        }
+
+    def calibrate(self, function) -> int:
+        """Find the calls per loop that take at least the minimum loop time, doubling from a single call."""
+        calls = 1
+        while self.time_loop(function, calls) < self.min_loop_time:
+            calls *= 2
+        return calls
+
+    def time_loop(self, function, calls: int) -> float:
+        """Call a function the given times, returns the seconds it took. The garbage collector is off while timing."""
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(calls):
+                function()
+            return time.perf_counter() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def run_all(self, benchmarks: list[Benchmark], report=print) -> dict:
+        """Time every benchmark, reporting each result as soon as it is known."""
+        results = {}
+        for benchmark in benchmarks:
+            results[benchmark.name] = self.run(benchmark)
+            report(self.format_result(benchmark.name, results[benchmark.name]))
+        return results
+
+    def format_result(self, name: str, result: dict) -> str:
+        """Format a result as a single line."""
+        return (
+            f"{name:<36} {result['median']:>12.3f} us  "
+            f"(min {result['min']:.3f}, p25 {result['p25']:.3f}, p75 {result['p75']:.3f}, "
+            f"spread {result['spread']:.1%}, {result['calls']} calls)"
+        )
+
+    @staticmethod
+    def save_baseline(file_path: Path, results: dict):
+        """Save results as a baseline."""
+        with open(file_path, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    @staticmethod
+    def load_baseline(file_path: Path) -> dict:
+        """Load the results of a baseline."""
+        with open(file_path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def compare(results: dict, baseline: dict, threshold: float) -> list[tuple[str, float, str]]:
+        """Compare the medians with a baseline, returns the name, ratio and verdict of every benchmark in both.
+        A benchmark slower than the baseline by more than the threshold is a regression."""
+        comparison = []
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+
+            ratio = result["median"] / baseline[name]["median"]
+            if ratio > 1 + threshold:
+                verdict = "regression"
+            elif ratio < 1 - threshold:
+                verdict = "improvement"
+            else:
+                verdict = "unchanged"
+            comparison.append((name, ratio, verdict))
+        return comparison
@@ -0,0 +1,55 @@
+import math
+from core.car import Car
+from core.car_properties import CarProperties
+from core.enums.direction import Direction
+from core.input_state import InputState
+from core.position import Position
+from core.race_rules import RaceRules
+from core.sprites.sprite import Sprite
+from settings import Settings
+
+
+class AICar(Car):
+    """Class for handeling a car driven by the computer, it steers towards its next checkpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        sprite: Sprite,
+        position: Position,
+        properties: CarProperties,
+        font_service=None,
+    ):
+        super().__init__(name, sprite, position, properties, font_service)
+        self.race_rules = None
+
+    def follow_route(self, race_rules: RaceRules):
+        """Drive along the checkpoints of a race, in the order the race rules expect them."""
+        self.race_rules = race_rules
+
+    def read_input(self, input_state: InputState):
+        """Steer towards the next checkpoint, braking for sharp turns and stopping after the finish."""
+        self.input = []
+        if self.race_rules is None or not self.race_rules.checkpoints:
+            return
+
+        progress = self.race_rules.get_progress(self)
+        if progress.finished:
+            return
+
+        x, y = self.position.get_pos()
+        target_x, target_y = self.race_rules.checkpoints[progress.next_checkpoint].center
+        heading = math.degrees(math.atan2(target_x - x, y - target_y))
+
+        # Turn the shortest way around
+        difference = (heading - self.statistics.current.rotation + 180) % 360 - 180
+        if difference > self.properties.handling / 2:
+            self.input.append(Direction.RIGHT)
+        elif difference < -self.properties.handling / 2:
+            self.input.append(Direction.LEFT)
+
+        speed = self.statistics.current.speed
+        if abs(difference) > Settings.AI_BRAKING_ANGLE and speed > self.properties.max_speed / 2:
+            self.input.append(Direction.DOWN)
+        else:
+            self.input.append(Direction.UP)
@@ -0,0 +1,55 @@
+import pygame
+from core.position import Position
+
+
+class Camera:
+    """Camera showing part of the world in a viewport on the screen.
+    Along an axis where the world fits in the viewport the camera stays put, so small maps are drawn where they are."""
+
+    def __init__(self, viewport: pygame.Rect, world_bounds: pygame.Rect):
+        self.viewport = pygame.Rect(viewport)
+        self.world_bounds = pygame.Rect(world_bounds)
+        self.position = Position(self.world_bounds.topleft)
+
+    def get_view_rect(self) -> pygame.Rect:
+        """Get the rect of the world that is visible in the viewport."""
+        return pygame.Rect(self.position.get_pos(), self.viewport.size)
+
+    def get_offset(self) -> tuple[int, int]:
+        """Get the offset that converts world positions to screen positions."""
+        x, y = self.position.get_pos()
+        return (self.viewport.x - x, self.viewport.y - y)
+
+    def world_to_screen(self, position: tuple[float, float]) -> tuple[float, float]:
+        """Convert a world position to a screen position."""
+        offset_x, offset_y = self.get_offset()
+        return (position[0] + offset_x, position[1] + offset_y)
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """Check if a world rect is inside the view."""
+        return self.get_view_rect().colliderect(rect)
+
+    def follow(self, position: Position):
+        """Center the view on a world position, clamped so it doesn't show beyond the world bounds."""
+        x, y = position.get_pos()
+        self.position = Position(
+            (
+                self.clamp(
+                    x - self.viewport.width / 2,
+                    self.world_bounds.left,
+                    self.world_bounds.right - self.viewport.width,
+                ),
+                self.clamp(
+                    y - self.viewport.height / 2,
+                    self.world_bounds.top,
+                    self.world_bounds.bottom - self.viewport.height,
+                ),
+            )
+        )
+
+    @staticmethod
+    def clamp(value: float, minimum: float, maximum: float) -> int:
+        """Clamp a camera coordinate, when the world fits the viewport it stays at the minimum."""
+        if maximum <= minimum:
+            return int(minimum)
+        return int(max(minimum, min(value, maximum)))
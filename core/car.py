@@ -6,6 +6,7 @@ import pygame
 from core.car_properties import CarProperties
 from core.car_statistics import CarStatistics
 from core.components.label_component import LabelComponent
+from core.dirty_region import DirtyRegion
 from core.enums.alignment import Alignment
 from core.enums.direction import Direction
 from core.event_handler import EventHandler
@@ -13,13 +14,19 @@ from core.input_state import InputState
 from core.position import Position
 from core.relative import Relative
 from core.sprites.sprite import Sprite
+from settings import Settings
 
 
 class Car:
     """Class for handeling a Car."""
 
     def __init__(
-        self, name: str, sprite: Sprite, position: Position, properties: CarProperties
+        self,
+        name: str,
+        sprite: Sprite,
+        position: Position,
+        properties: CarProperties,
+        font_service=None,
     ):
         self.name = name
         self.sprite = sprite
@@ -33,7 +40,9 @@ class Car:
         self.score = 0
         self.lap = 0
         self.penalties = 0
+        self.collisions = 0
         self.place = 0
+        self.input = []
 
         self.sprite.position = self.position
 
@@ -46,8 +55,12 @@ class Car:
             color=(255, 255, 255),
             outline_color=(0, 0, 0),
             parent=self,
+            font_service=font_service,
         )
 
+        self.dirty_region = DirtyRegion()
+        self.render_state = None
+
         # Create events
         self.events = SimpleNamespace()
         self.events.on_car_driving = EventHandler()
@@ -71,21 +84,124 @@ class Car:
         return (int(self.__size * self.__scale), int(self.__size * self.__scale))
 
     def update(self, delta_time: float, input_state: InputState):
-        """Update the car."""
+        """Update the car, reading and applying its controls."""
+        self.read_input(input_state)
+        self.apply_controls()
+
+    def read_input(self, input_state: InputState):
+        """Read the directions the car is steered in, cars without a driver have none."""
+        self.input = []
+
+    def apply_controls(self):
+        """Apply the directions read from the input, drag slows the car down when it isn't accelerating or braking."""
+        if Direction.UP in self.input:
+            self.handle_controls(Direction.UP)
+        elif Direction.DOWN in self.input:
+            self.handle_controls(Direction.DOWN)
+        else:
+            self.apply_drag()
+
+        if Direction.LEFT in self.input:
+            self.handle_controls(Direction.LEFT)
+        elif Direction.RIGHT in self.input:
+            self.handle_controls(Direction.RIGHT)
+
         self.statistics.update()
 
-    def draw(self, screen, opacity: int = 255):
-        """Draw the car."""
+    def draw(
+        self,
+        screen,
+        opacity: int = 255,
+        screen_offset: tuple[float, float] = (0, 0),
+        interpolation: float = 1.0,
+    ):
+        """Draw the car, the screen offset converts its world position to the screen.
+        The car is drawn between its previous and current tick by the interpolation."""
+        screen_offset = self.apply_render_state(screen_offset, interpolation)
+
         # Draw the car
-        self.sprite.draw(screen, opacity)
+        self.sprite.draw(screen, opacity, screen_offset)
 
         # Draw the name
-        self.name_label.draw(screen, opacity)
+        self.name_label.draw(screen, opacity, screen_offset)
+
+        self.restore_render_state()
 
     def handle_event(self, event):
         """Handle any non pygame.QUIT event."""
         return
 
+    def get_dirty_rects(
+        self, screen_offset: tuple[float, float] = (0, 0), interpolation: float = 1.0
+    ):
+        """Return the old and new screen rects of the car and its name when it moved or turned."""
+        screen_offset = self.apply_render_state(screen_offset, interpolation)
+        sprite, _ = self.sprite.get_sprite()
+        dirty_rects = self.dirty_region.update(
+            sprite, self.sprite.get_rect(screen_offset)
+        ) + self.name_label.get_dirty_rects(screen_offset)
+
+        self.restore_render_state()
+        return dirty_rects
+
+    def get_rect(self) -> pygame.Rect:
+        """Return the world rect the car covers when drawn."""
+        return self.sprite.get_rect()
+
+    def save_state(self):
+        """Remember the state at the start of a tick, frames are drawn between it and the current state."""
+        self.render_state = SimpleNamespace(
+            position=self.position.get_pos(),
+            rotation=self.sprite.rotation,
+            simulated_rotation=None,
+        )
+
+    def get_render_position(self, interpolation: float) -> Position:
+        """Return the position the car is drawn at, between its previous and current tick."""
+        if self.render_state is None or interpolation >= 1:
+            return self.position
+
+        x, y = self.position.get_pos()
+        previous_x, previous_y = self.render_state.position
+        return Position(
+            (
+                previous_x + (x - previous_x) * interpolation,
+                previous_y + (y - previous_y) * interpolation,
+            )
+        )
+
+    def apply_render_state(
+        self, screen_offset: tuple[float, float], interpolation: float
+    ) -> tuple[float, float]:
+        """Turn the sprite to the interpolated rotation, returns the screen offset moved to the interpolated position.
+        The simulated rotation is put back by restore_render_state."""
+        if self.render_state is None or interpolation >= 1:
+            return screen_offset
+
+        # The offset from the current position to the interpolated position
+        x, y = self.position.get_pos()
+        render_x, render_y = self.get_render_position(interpolation).get_pos()
+        screen_offset = (
+            screen_offset[0] + render_x - x,
+            screen_offset[1] + render_y - y,
+        )
+
+        previous_rotation = self.render_state.rotation
+        rotation = self.sprite.rotation
+        if previous_rotation is not None and rotation is not None:
+            # Turn the shortest way around
+            difference = (rotation - previous_rotation + 180) % 360 - 180
+            self.render_state.simulated_rotation = rotation
+            self.sprite.rotation = (previous_rotation + difference * interpolation) % 360
+
+        return screen_offset
+
+    def restore_render_state(self):
+        """Put the simulated rotation back on the sprite after drawing."""
+        if self.render_state is not None and self.render_state.simulated_rotation is not None:
+            self.sprite.rotation = self.render_state.simulated_rotation
+            self.render_state.simulated_rotation = None
+
     def apply_drag(self):
         """Apply drag to the car, decreasing the speed."""
         speed = self.statistics.current.speed
@@ -136,15 +252,22 @@ class Car:
         self.statistics.current.speed = current_speed
         self.set_rotation(current_rotation)
 
-    def move(self, timedelta, collisions):
-        """Move the car, and handle collisions"""
+    def integrate(self, timedelta):
+        """Move the car by its speed in the direction it is facing."""
         self.events.on_car_driving.notify(self)
         self.previous_position = copy.copy(self.position)
 
+        # The speed scale keeps the pace cars had when they moved once per player, see Settings.SPEED_SCALE
+        distance = self.statistics.current.speed * Settings.SPEED_SCALE * timedelta
         rad = math.radians(self.statistics.current.rotation)
-        direction_x = self.statistics.current.speed * math.sin(rad) * timedelta
-        direction_y = -self.statistics.current.speed * math.cos(rad) * timedelta
+        direction_x = distance * math.sin(rad)
+        direction_y = -distance * math.cos(rad)
+
+        new_position = Position(self.position + Position((direction_x, direction_y)))
+        self.set_position(new_position)
 
+    def resolve_collisions(self, collisions):
+        """Handle the collisions found after moving, a car over its tolerance is moved back and reset."""
         if collisions:
             self.handle_collisions(collisions)
         else:
@@ -152,14 +275,13 @@ class Car:
                 self.statistics.current.tolerance -= 1
 
         if self.statistics.current.tolerance > self.properties.tolerance:
+            if self.previous_position is not None:
+                self.set_position(self.previous_position)
             self.reset_to_last_checkpoint()
-            return
-
-        new_position = Position(self.position + Position((direction_x, direction_y)))
-        self.set_position(new_position)
 
     def handle_collisions(self, collisions):
         """Handle collisions with other objects."""
+        self.collisions += len(collisions)
         for collision in collisions:
             if isinstance(collision, Car):
                 self.statistics.current.speed *= 0.2
@@ -2,6 +2,7 @@ from types import SimpleNamespace
 import pygame
 from core.components.component_base import ComponentBase
 from core.components.label_component import LabelComponent
+from core.dirty_region import DirtyRegion
 from core.enums.alignment import Alignment
 from core.position import Position
 from core.relative import Relative
@@ -26,6 +27,7 @@ class ButtonComponent(ComponentBase):
         outline_color=(255, 255, 255),
         alignment: Alignment = None,
         parent=None,
+        font_service=None,
     ):
         super().__init__(name, position, alignment, parent)
         self.text = text
@@ -43,6 +45,7 @@ class ButtonComponent(ComponentBase):
 
         self.hover = False
         self.active = False
+        self.dirty_region = DirtyRegion()
 
         self.scaled_size = self.background_sprite.get_scaled_size()
 
@@ -56,6 +59,7 @@ class ButtonComponent(ComponentBase):
             color,
             outline_color,
             self,
+            font_service,
         )
 
         self.children.append(text_component)
@@ -96,6 +100,16 @@ class ButtonComponent(ComponentBase):
 
         super().draw(screen, opacity)  # Draw children after the background
 
+    def get_dirty_rects(self):
+        """Return the background rect when the hover or active state changed, and the changed rects of the children."""
+        rect = pygame.Rect(self.position.get_pos(), self.scaled_size).inflate(2, 2)
+        dirty_rects = self.dirty_region.update((self.hover, self.active), rect)
+
+        children_rects = super().get_dirty_rects()
+        if children_rects is None:
+            return None
+        return dirty_rects + children_rects
+
     def get_button_collision(self):
         """Check if the mouse is colliding with the button."""
         return pygame.Rect(
@@ -5,6 +5,7 @@ from core.car import Car
 from core.components.button_component import ButtonComponent
 from core.components.component_base import ComponentBase
 from core.components.label_component import LabelComponent
+from core.dirty_region import DirtyRegion
 from core.enums.alignment import Alignment
 from core.event_handler import EventHandler
 from core.position import Position
@@ -22,13 +23,16 @@ class CarOptionsPanel(ComponentBase):
         position: Position = Position((0, 0)),
         alignment: Alignment = None,
         parent=None,
+        font_service=None,
     ):
         super().__init__(name, position, alignment, parent)
+        self.font_service = font_service
         self.ready = False
         self.cars = cars
         self.selected_car = None
         self.selected_button = None
         self.scaled_size = (400, 600)
+        self.dirty_region = DirtyRegion()
 
         segment_positions = Helper.get_middle_positions(
             self.parent.scaled_size[0], len(cars)
@@ -43,6 +47,7 @@ class CarOptionsPanel(ComponentBase):
                 cars[i].sprite,
                 cars[i].sprite,
                 parent=self,
+                font_service=self.font_service,
             )
             car_option.align(Alignment.CENTER, car_option.scaled_size[0])
             car_option.events.on_button_clicked += self.car_selected
@@ -78,6 +83,22 @@ class CarOptionsPanel(ComponentBase):
 
         super().draw(screen, opacity)
 
+    def get_dirty_rects(self):
+        """Return the outline rects when the selected car changed, and the changed rects of the children."""
+        rect = None
+        if self.selected_button is not None:
+            rect = Helper.get_outline_rect(
+                self.selected_button.position.get_pos(),
+                self.selected_button.scaled_size,
+                2,
+            )
+        dirty_rects = self.dirty_region.update(self.selected_button, rect)
+
+        children_rects = super().get_dirty_rects()
+        if children_rects is None:
+            return None
+        return dirty_rects + children_rects
+
     def get_car_by_name(self, car_name) -> Car:
         for car in self.cars:
             if car.name == car_name:
@@ -105,6 +126,7 @@ class CarOptionsPanel(ComponentBase):
                 Alignment.LEFT,
                 30,
                 parent=self,
+                font_service=self.font_service,
             )
             self.children.append(label)
 
@@ -131,6 +153,7 @@ class CarOptionsPanel(ComponentBase):
                 Alignment.RIGHT,
                 30,
                 parent=self,
+                font_service=self.font_service,
             )
             self.children.append(label)
 
@@ -5,6 +5,7 @@ from core.components.car_options_panel import CarOptionsPanel
 from core.components.component_base import ComponentBase
 from core.components.label_component import LabelComponent
 from core.components.textbox_component import TextboxComponent
+from core.dirty_region import DirtyRegion
 from core.enums.alignment import Alignment
 from core.enums.log_level import LogLevel
 from core.enums.sprite_type import SpriteType
@@ -12,6 +13,7 @@ from core.event_handler import EventHandler
 from core.player_car import PlayerCar
 from core.position import Position
 from core.relative import Relative
+from core.services.font_service import FontService
 from core.services.sprite_service import SpriteService
 from utilities.helper import Helper
 
@@ -26,6 +28,7 @@ class CarSelectionPanel(ComponentBase):
         cars: list[PlayerCar],
         position: Position,
         sprite_service: SpriteService,
+        font_service: FontService,
         alignment: Alignment = None,
         parent=None,
     ):
@@ -33,9 +36,11 @@ class CarSelectionPanel(ComponentBase):
         self.player_id = player_id
         self.scaled_size = (400, 600)
         self.ready = False
+        self.dirty_region = DirtyRegion()
 
         self.services = SimpleNamespace()
         self.services.sprite = sprite_service
+        self.services.font = font_service
 
         self.player_name_textbox = TextboxComponent(
             f"player_name_{self.player_id}",
@@ -46,6 +51,7 @@ class CarSelectionPanel(ComponentBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "blue_button13.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button13.png"),
             parent=self,
+            font_service=self.services.font,
         )
         self.player_name_textbox.align(
             Alignment.RIGHT, self.player_name_textbox.scaled_size[0]
@@ -59,6 +65,7 @@ class CarSelectionPanel(ComponentBase):
             Alignment.LEFT,
             36,
             parent=self,
+            font_service=self.services.font,
         )
         self.children.append(self.player_name_label)
 
@@ -67,6 +74,7 @@ class CarSelectionPanel(ComponentBase):
             cars,
             Relative(self.position, (self.scaled_size[0] / 2, 120)),
             parent=self,
+            font_service=self.services.font,
         )
         self.car_options.align(Alignment.CENTER, self.scaled_size[0])
         self.children.append(self.car_options)
@@ -82,6 +90,7 @@ class CarSelectionPanel(ComponentBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         self.ready_check.align(Alignment.CENTER, self.ready_check.scaled_size[0])
         self.ready_check.events.on_button_clicked += self.ready_clicked
@@ -116,6 +125,16 @@ class CarSelectionPanel(ComponentBase):
             
         super().draw(screen, opacity)
 
+    def get_dirty_rects(self):
+        """Return the outline rect when the ready state changed, and the changed rects of the children."""
+        rect = Helper.get_outline_rect(self.position.get_pos(), self.scaled_size, 2)
+        dirty_rects = self.dirty_region.update(self.ready, rect)
+
+        children_rects = super().get_dirty_rects()
+        if children_rects is None:
+            return None
+        return dirty_rects + children_rects
+
     def ready_clicked(self, sender: ButtonComponent):
         """Notify that the player is ready to proceed."""
         nickname = self.player_name_textbox.get_value()
@@ -38,6 +38,16 @@ class ComponentBase:
         for child in self.children:
             child.draw(screen, opacity)
 
+    def get_dirty_rects(self):
+        """Return the screen rects that changed since the last call, None when unknown and the screen should be redrawn."""
+        dirty_rects = []
+        for child in self.children:
+            child_rects = child.get_dirty_rects()
+            if child_rects is None:
+                return None
+            dirty_rects += child_rects
+        return dirty_rects
+
     def align(self, alignment: Alignment, width):
         """Align the button to the center of the position."""
         self.restore_alignment(self.alignment, width)
@@ -18,9 +18,19 @@ class CountdownComponent(LabelComponent):
         color=(0, 0, 0),
         outline_color=(255, 255, 255),
         parent=None,
+        font_service=None,
     ):
         super().__init__(
-            name, position, "", alignment, font_size, font, color, outline_color, parent
+            name,
+            position,
+            "",
+            alignment,
+            font_size,
+            font,
+            color,
+            outline_color,
+            parent,
+            font_service,
         )
         self.text = texts_timeouts[0][0]
         self.timeout = texts_timeouts[0][1]
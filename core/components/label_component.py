@@ -1,10 +1,16 @@
 import pygame
 from core.components.component_base import ComponentBase
+from core.dirty_region import DirtyRegion
 from core.enums.alignment import Alignment
 from core.position import Position
+from core.text_render_cache import TextRenderCache
+from settings import Settings
 
 
 class LabelComponent(ComponentBase):
+    # Rendered texts are shared by all labels, labels with unchanged text only cost a blit
+    render_cache = TextRenderCache(Settings.TEXT_RENDER_CACHE_BUDGET)
+
     def __init__(
         self,
         name,
@@ -16,6 +22,7 @@ class LabelComponent(ComponentBase):
         color=(0, 0, 0),
         outline_color=(255, 255, 255),
         parent=None,
+        font_service=None,
     ):
         super().__init__(name, position, alignment, parent)
         self.text = text
@@ -24,8 +31,14 @@ class LabelComponent(ComponentBase):
         self.color = color
         self.outline_color = outline_color
 
-        self.font = pygame.font.Font(self.font, self.font_size)
+        # Labels share their font through the font service when one is given
+        self.font_face = font
+        if font_service is not None:
+            self.font = font_service.get_font(self.font_face, self.font_size)
+        else:
+            self.font = pygame.font.Font(self.font, self.font_size)
         self.scaled_size = self.font.size(self.text)
+        self.dirty_region = DirtyRegion()
 
     def handle_event(self, event):
         """This component does not handle events."""
@@ -35,15 +48,59 @@ class LabelComponent(ComponentBase):
         """Update the component and all its children"""        
         return
 
-    def draw(self, screen, opacity: int = 255):
-        """Draw the component and all its children."""
-        # Render the text with opacity, and center it
-        rendered_text = self.font.render(self.text, True, (255, 255, 255, opacity))
-        rendered_text.set_alpha(opacity)
+    def draw(
+        self,
+        screen,
+        opacity: int = 255,
+        screen_offset: tuple[float, float] = (0, 0),
+    ):
+        """Draw the component and all its children, the screen offset is added to the position."""
+        # The rendered text is shared, so the opacity is set right before drawing it
+        rendered_text = self.get_rendered_text()
+        rendered_text.set_alpha(opacity if opacity < 255 else None)
+        draw_x, draw_y = self.get_draw_position()
+
+        # The rendered text has a 1 pixel outline around it
+        screen.blit(
+            rendered_text,
+            (draw_x - 1 + screen_offset[0], draw_y - 1 + screen_offset[1]),
+        )
+
+        super().draw(screen, opacity)  # Draw children after the background
+
+    def get_rendered_text(self) -> pygame.Surface:
+        """Get the rendered text with its outline, from the cache when it was rendered before."""
+        key = (self.font_face, self.font_size, self.text, (255, 255, 255), (0, 0, 0))
+        return self.render_cache.get(key, self.render_text)
+
+    def render_text(self) -> pygame.Surface:
+        """Render the text and its outline onto one surface."""
+        rendered_text = self.font.render(self.text, True, (255, 255, 255))
+        rendered_text_outline = self.font.render(self.text, True, (0, 0, 0))
+
+        surface = pygame.Surface(
+            (rendered_text.get_width() + 2, rendered_text.get_height() + 2),
+            pygame.SRCALPHA,
+        )
+
+        # Draw the outline first
+        for x_offset in [0, 2]:
+            for y_offset in [0, 2]:
+                surface.blit(rendered_text_outline, (x_offset, y_offset))
+
+        surface.blit(rendered_text, (1, 1))
+        return surface
+
+    def get_draw_position(self) -> tuple[float, float]:
+        """Get the top left position of the text, after applying the alignment."""
         draw_x = self.position.get_pos()[0]
         draw_y = self.position.get_pos()[1]
 
-        self.scaled_size = self.font.size(self.text)
+        rendered_text = self.get_rendered_text()
+        self.scaled_size = (
+            rendered_text.get_width() - 2,
+            rendered_text.get_height() - 2,
+        )
         match self.alignment:
             case Alignment.LEFT:
                 draw_y -= self.scaled_size[1] / 2.0
@@ -54,17 +111,12 @@ class LabelComponent(ComponentBase):
                 draw_x -= self.scaled_size[0]
                 draw_y -= self.scaled_size[1] / 2.0
 
-        # Draw the outline first
-        rendered_text_outline = self.font.render(self.text, True, (0, 0, 0))
-        rendered_text_outline.set_alpha(opacity)
-
-        for x_offset in [-1, 1]:
-            for y_offset in [-1, 1]:
-                screen.blit(
-                    rendered_text_outline, (draw_x + x_offset, draw_y + y_offset)
-                )
-
-        # Draw the text with opacity
-        screen.blit(rendered_text, (draw_x, draw_y))
+        return (draw_x, draw_y)
 
-        super().draw(screen, opacity)  # Draw children after the background
\ No newline at end of file
+    def get_dirty_rects(self, screen_offset: tuple[float, float] = (0, 0)):
+        """Return the old and new text rect when the text or its position changed."""
+        draw_x, draw_y = self.get_draw_position()
+        rect = pygame.Rect(
+            (draw_x + screen_offset[0], draw_y + screen_offset[1]), self.scaled_size
+        ).inflate(4, 4)
+        return self.dirty_region.update(self.text, rect) + super().get_dirty_rects()
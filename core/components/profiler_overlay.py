@@ -0,0 +1,127 @@
+import time
+import pygame
+from core.components.component_base import ComponentBase
+from core.components.label_component import LabelComponent
+from core.dirty_region import DirtyRegion
+from core.enums.alignment import Alignment
+from core.position import Position
+from core.relative import Relative
+from settings import Settings
+
+
+class ProfilerOverlay(ComponentBase):
+    """Shows the frames per second, the profiler key expands it to the p50, p95 and p99 of every stage and a frame time graph."""
+
+    GRAPH_SIZE = (360, 80)
+    ROW_HEIGHT = 18
+
+    def __init__(
+        self,
+        name,
+        position: Position,
+        profiler,
+        parent=None,
+        font_service=None,
+    ):
+        super().__init__(name, position, None, parent)
+        self.profiler = profiler
+        self.expanded = False
+
+        if font_service is not None:
+            self.font = font_service.get_font(None, 16)
+        else:
+            self.font = pygame.font.Font(None, 16)
+
+        self.fps_label = LabelComponent(
+            f"{name}_fps",
+            Relative(self.position, (20, 0)),
+            "",
+            Alignment.CENTER,
+            16,
+            parent=self,
+            font_service=font_service,
+        )
+        self.children.append(self.fps_label)
+
+        self.surface = None
+        self.refreshed_at = 0.0
+        self.dirty_region = DirtyRegion()
+
+    def handle_event(self, event):
+        """Toggle the stage times with the profiler key."""
+        if event.type == pygame.KEYUP and event.key == Settings.PROFILER_KEY:
+            self.expanded = not self.expanded
+            self.refreshed_at = 0.0
+
+    def update(self, timedelta, input_state):
+        """Refresh the shown times a few times per second, rendering them every frame would cost more than it shows."""
+        if time.perf_counter() - self.refreshed_at < Settings.PROFILER_REFRESH:
+            return
+        self.refreshed_at = time.perf_counter()
+
+        frame_time, _, _ = self.profiler.get_percentiles("frame")
+        self.fps_label.text = f"FPS: {1000 // frame_time if frame_time > 0 else 0}"
+        self.surface = self.render_stages() if self.expanded else None
+
+    def draw(self, screen, opacity: int = 255):
+        """Draw the frames per second, and the stage times when expanded."""
+        if self.surface is not None:
+            screen.blit(self.surface, self.get_stages_position())
+
+        super().draw(screen, opacity)
+
+    def get_stages_position(self) -> tuple[float, float]:
+        """Get the top left position of the stage times, below the frames per second."""
+        x, y = self.position.get_pos()
+        return (x, y + self.ROW_HEIGHT)
+
+    def render_stages(self) -> pygame.Surface:
+        """Render a row with the p50, p95 and p99 of every stage, followed by the frame time graph."""
+        names = ["frame"] + [name for name in self.profiler.samples if name != "frame"]
+        rows = [("stage", "p50", "p95", "p99")] + [
+            (name, *[f"{value:.2f}" for value in self.profiler.get_percentiles(name)])
+            for name in names
+        ]
+
+        graph_width, graph_height = self.GRAPH_SIZE
+        surface = pygame.Surface(
+            (graph_width + 16, len(rows) * self.ROW_HEIGHT + graph_height + 24),
+            pygame.SRCALPHA,
+        )
+        surface.fill((0, 0, 0, 180))
+
+        for index, row in enumerate(rows):
+            y = 8 + index * self.ROW_HEIGHT
+            for column, (text, x) in enumerate(zip(row, (8, 200, 260, 320))):
+                color = (255, 255, 0) if index == 0 else (255, 255, 255)
+                surface.blit(self.font.render(text, True, color), (x, y))
+
+        self.draw_graph(surface, (8, 16 + len(rows) * self.ROW_HEIGHT))
+        return surface
+
+    def draw_graph(self, surface: pygame.Surface, position: tuple[int, int]):
+        """Draw the latest frame times as bars, the line is the time a frame may take at the target frame rate."""
+        graph_width, graph_height = self.GRAPH_SIZE
+        x, y = position
+        budget = 1000 / Settings.FPS
+        scale = graph_height / (budget * 2)
+
+        frame_times = self.profiler.get_history("frame")[-(graph_width // 2) :]
+        for index, frame_time in enumerate(frame_times):
+            height = min(graph_height, int(frame_time * scale))
+            color = (0, 200, 0) if frame_time <= budget else (220, 40, 40)
+            pygame.draw.rect(
+                surface,
+                color,
+                (x + index * 2, y + graph_height - height, 2, height),
+            )
+
+        budget_y = y + graph_height - int(budget * scale)
+        pygame.draw.line(surface, (255, 255, 0), (x, budget_y), (x + graph_width, budget_y))
+
+    def get_dirty_rects(self):
+        """Return the old and new rect of the stage times when they were refreshed, and the changed frames per second."""
+        rect = None
+        if self.surface is not None:
+            rect = pygame.Rect(self.get_stages_position(), self.surface.get_size())
+        return self.dirty_region.update(self.surface, rect) + super().get_dirty_rects()
@@ -22,10 +22,13 @@ class StatisticsPanel(ComponentBase):
         position: Position = Position((0, 0)),
         alignment: Alignment = None,
         parent=None,
+        font_service=None,
     ):
         super().__init__(name, position, alignment, parent)
         self.car = car
+        self.font_service = font_service
         self.scaled_size = (400, 100)
+        self.rect = None
 
         self.create_labels()
         self.create_values()
@@ -41,7 +44,10 @@ class StatisticsPanel(ComponentBase):
         self.show_car_info()
 
     def draw(self, screen, opacity: int = 255):
-        """Draw the component and all its children"""
+        """Draw the component and all its children, nothing is drawn when the panel is outside the clip."""
+        if self.rect is not None and not self.rect.colliderect(screen.get_clip()):
+            return
+
         Helper.draw_outline(
             screen,
             self.position.get_pos(),
@@ -53,6 +59,15 @@ class StatisticsPanel(ComponentBase):
 
         super().draw(screen, opacity)
 
+    def get_dirty_rects(self):
+        """Return the changed rects of the labels, the panel remembers the rect it and its labels are drawn in."""
+        dirty_rects = super().get_dirty_rects()
+        if dirty_rects is not None:
+            self.rect = Helper.get_outline_rect(
+                self.position.get_pos(), self.scaled_size, 2
+            ).unionall([child.dirty_region.rect for child in self.children])
+        return dirty_rects
+
     def get_car_by_name(self, car_name) -> Car:
         for car in self.cars:
             if car.name == car_name:
@@ -70,6 +85,7 @@ class StatisticsPanel(ComponentBase):
                 alignment,
                 24,
                 parent=self,
+                font_service=self.font_service,
             )
             self.children.append(label)
 
@@ -2,8 +2,10 @@ import pygame
 from injector import Injector, singleton
 from core.game_engine import GameEngine
 from core.services.collision_service import CollisionService
+from core.services.font_service import FontService
 from core.services.log_service import LogService
 from core.services.map_service import MapService
+from core.services.profiler_service import ProfilerService
 from core.services.scene_service import SceneService
 from core.services.score_service import ScoreService
 from core.services.sound_service import SoundService
@@ -44,7 +46,9 @@ class DI:
 
         binder.bind(LogService, to=LogService, scope=singleton)
         binder.bind(CollisionService, to=CollisionService, scope=singleton)
+        binder.bind(FontService, to=FontService, scope=singleton)
         binder.bind(MapService, to=MapService, scope=singleton)
+        binder.bind(ProfilerService, to=ProfilerService, scope=singleton)
         binder.bind(SceneService, to=SceneService, scope=singleton)
         binder.bind(ScoreService, to=ScoreService, scope=singleton)
         binder.bind(SoundService, to=SoundService, scope=singleton)
@@ -0,0 +1,23 @@
+import pygame
+
+
+class DirtyRegion:
+    """Remembers what a drawable showed last frame, used by the dirty rectangle rendering mode to find changed regions."""
+
+    def __init__(self):
+        self.state = None
+        self.rect = None
+
+    def update(self, state, rect: pygame.Rect | None) -> list[pygame.Rect]:
+        """Store the current state and rect, returns the old and new rect when either of them changed."""
+        if state == self.state and rect == self.rect:
+            return []
+
+        rects = [
+            changed_rect
+            for changed_rect in (self.rect, rect)
+            if changed_rect is not None
+        ]
+        self.state = state
+        self.rect = rect
+        return rects
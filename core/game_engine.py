@@ -1,12 +1,15 @@
+import time
 from types import SimpleNamespace
 from injector import inject
 import pygame
 from core.enums.scene import Scene
 from core.input_state import InputState
+from core.services.profiler_service import ProfilerService
 from core.services.scene_service import SceneService
 from core.services.score_service import ScoreService
 
 from settings import Settings
+from utilities.helper import Helper
 
 
 class GameEngine:
@@ -19,6 +22,7 @@ class GameEngine:
         settings: Settings,
         scene_service: SceneService,
         score_service: ScoreService,
+        profiler_service: ProfilerService,
     ):
         self.input_state = InputState()
         self.screen = screen
@@ -28,34 +32,58 @@ class GameEngine:
         self.services = SimpleNamespace()
         self.services.scene = scene_service
         self.services.score = score_service
-
+        self.services.profiler = profiler_service
 
     def run_game_loop(self):
         """Run the game loop as long as running is true, sending the pygame.event QUIT will gracefully end the loop."""
         self.services.scene.initialize_scenes()
         self.services.scene.set_active_scene(Scene.MAINSCENE)
 
+        # Fixed timestep, the simulation always advances a whole tick and frames render in between
+        tick_time = 1.0 / Settings.TICK_RATE
+        accumulator = 0.0
+
         running = True
         while running:
-            timedelta = self.clock.tick(Settings.FPS) / 1000.0
+            frame_time = self.clock.tick(Settings.FPS) / 1000.0
+            profiler = self.services.profiler
+            profiler.record("frame", frame_time)
 
+            start = time.perf_counter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 else:
                     self.handle_event(event)
+            profiler.record("events", time.perf_counter() - start)
+
+            # Update physics, catching up on the ticks due since the last frame
+            accumulator += frame_time
+            ticks = 0
+            while accumulator >= tick_time and ticks < Settings.MAX_CATCH_UP_TICKS:
+                # Update input state
+                self.input_state.update()
 
-            # Update input state
-            self.input_state.update()
+                profiler.measure("update", self.update, tick_time)
+                accumulator -= tick_time
+                ticks += 1
 
-            # Update physics
-            self.update(timedelta)
+            # Drop the time that can't be caught up on, the simulation slows down instead of spiraling
+            if ticks == Settings.MAX_CATCH_UP_TICKS:
+                accumulator = min(accumulator, tick_time)
 
-            # Drawing
-            self.draw()
+            # Drawing, interpolated between the previous and current tick
+            dirty_rects = profiler.measure("draw", self.draw, accumulator / tick_time)
 
-            # Flip the display
-            pygame.display.flip()
+            # Flip the display, or only push the changed regions in dirty rectangle mode
+            start = time.perf_counter()
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+            profiler.record("flip", time.perf_counter() - start)
+
+            profiler.end_frame()
 
     def handle_event(self, event):
         """Handle any non pygame.QUIT event. The event is passed down to all relevant services."""
@@ -66,10 +94,27 @@ class GameEngine:
 
         self.services.scene.update(timedelta, self.input_state)
 
-    def draw(self):
-        """Draw the game state."""
+    def draw(self, interpolation: float = 1.0):
+        """Draw the game state. Returns the changed rects in dirty rectangle mode, None when the whole screen was drawn.
+        The interpolation is how far the frame is between the previous and the current tick."""
+        self.services.scene.interpolation = interpolation
+
+        if Settings.DIRTY_RECTS:
+            dirty_rects = self.services.scene.get_dirty_rects()
+            if dirty_rects is not None:
+                # Redraw under every changed region on its own, a single clip around all of them
+                # would cover most of the screen as soon as two regions are far apart
+                dirty_rects = Helper.merge_rects(dirty_rects)
+                for rect in dirty_rects:
+                    self.screen.set_clip(rect)
+                    self.screen.fill((0, 0, 0))
+                    self.services.scene.draw(self.screen)
+                self.screen.set_clip(None)
+                return dirty_rects
+
         # Draw background
         self.screen.fill((0, 0, 0))
 
         # Draw all relevant services
         self.services.scene.draw(self.screen)
+        return None
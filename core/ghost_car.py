@@ -0,0 +1,61 @@
+from core.car import Car
+from core.car_properties import CarProperties
+from core.position import Position
+from core.sprites.sprite import Sprite
+from core.trace import Trace
+from settings import Settings
+
+
+class GhostCar(Car):
+    """Class for handeling a ghost car, it plays back a lap from a trace instead of driving.
+    Ghost cars are not simulated and don't collide, they are drawn translucent."""
+
+    def __init__(
+        self,
+        name: str,
+        sprite: Sprite,
+        properties: CarProperties,
+        trace: Trace,
+        lap: tuple[int, int, float],
+        font_service=None,
+    ):
+        super().__init__(name, sprite, Position((0, 0)), properties, font_service)
+        self.trace = trace
+        self.start_tick, self.end_tick, self.lap_time = lap
+
+        # The ghost waits at the start of its lap until the lap is started
+        self.tick = self.start_tick
+        self.playing = False
+        self.move_to_tick()
+
+    def start_lap(self):
+        """Play the lap from its start."""
+        self.tick = self.start_tick
+        self.playing = True
+        self.move_to_tick()
+        self.save_state()
+
+    def advance(self):
+        """Move to the next tick of the lap, the ghost stops at the end of its lap."""
+        self.save_state()
+        if self.playing and self.tick < self.end_tick:
+            self.tick += 1
+            self.move_to_tick()
+
+    def move_to_tick(self):
+        """Move and turn the car to the sample of the current tick."""
+        x, y, rotation = self.trace.get_sample(self.tick)
+        self.set_position(Position((x, y)))
+        self.set_rotation(rotation)
+
+    def draw(
+        self,
+        screen,
+        opacity: int = 255,
+        screen_offset: tuple[float, float] = (0, 0),
+        interpolation: float = 1.0,
+    ):
+        """Draw the car translucent."""
+        super().draw(
+            screen, opacity * Settings.GHOST_OPACITY // 255, screen_offset, interpolation
+        )
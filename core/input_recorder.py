@@ -0,0 +1,69 @@
+from pathlib import Path
+from core.player_car import PlayerCar
+from core.replay_file import ReplayFile
+from settings import Settings
+
+
+class InputRecorder:
+    """Records the input of the local players of a race to a replay file, every tick after the race started.
+    Together with the seed of the race, the input is all that is needed to replay the race exactly."""
+
+    def __init__(self, file_path: Path, race):
+        self.file_path = file_path
+        self.race = race
+        self.players = [player for player in race.players if isinstance(player, PlayerCar)]
+        self.file = None
+        self.tick = 0
+        self.previous_tick = 0
+        self.previous_input = None
+
+    def start(self):
+        """Write the header and record the input of every tick from now on."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.file_path, "wb")
+        ReplayFile.write_header(
+            self.file,
+            self.race.seed,
+            1.0 / Settings.TICK_RATE,
+            self.race.laps,
+            self.race.ai_drivers,
+            self.race.map_name,
+            [(self.race.get_car_option(player), player.name) for player in self.players],
+        )
+
+        self.race.events.on_stage_completed += self.handle_stage_completed
+        self.race.race_rules.events.on_race_finished += self.handle_race_finished
+
+    def stop(self):
+        """Write the tick the recording ends at and close the file."""
+        if self.file is None:
+            return
+
+        ReplayFile.write_record(
+            self.file,
+            self.tick - self.previous_tick,
+            ReplayFile.pack_input([[] for _ in self.players]),
+        )
+        self.file.close()
+        self.file = None
+
+    # ------------------------------
+    # Event handlers
+    # ------------------------------
+    def handle_stage_completed(self, stage, seconds):
+        """Handle the race stage completed event, the input is stored after it was read when it changed."""
+        if stage != "input" or self.file is None:
+            return
+
+        packed_input = ReplayFile.pack_input([player.input for player in self.players])
+        if packed_input != self.previous_input:
+            ReplayFile.write_record(self.file, self.tick - self.previous_tick, packed_input)
+            self.previous_tick = self.tick
+            self.previous_input = packed_input
+
+        self.tick += 1
+
+    def handle_race_finished(self, car):
+        """Handle the race finished event, the recording stops when every local player finished."""
+        if all(self.race.race_rules.get_progress(player).finished for player in self.players):
+            self.stop()
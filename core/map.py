@@ -1,28 +1,144 @@
 from argparse import FileType
+from types import SimpleNamespace
+import pygame
+from core.camera import Camera
 from core.car import Car
 from core.enums.direction import Direction
 
+from core.dirty_region import DirtyRegion
 from core.position import Position
 from core.enums.sprite_type import SpriteType
+from core.spatial_grid import SpatialGrid
 
 from settings import Settings
+from utilities.helper import Helper
 
 
 class Map:
     """Map class, used to store the map data and the map objects. This is what a player races on."""
 
-    def __init__(self, name: str, ground, road, objects, checkpoints) -> None:
+    def __init__(
+        self,
+        name: str,
+        ground,
+        road,
+        objects,
+        checkpoints,
+        width: int = 14,
+        height: int = 7,
+        tile_size: int = Settings.TILE_SIZE,
+    ) -> None:
         self.name = name
+        # JSON maps without dimensions are 14 by 7 tiles
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
         self.ground = ground
         self.road = road
         self.objects = objects
         self.checkpoints = checkpoints
 
+        self.collision_grid = None
+        self.collision_mask = None
+        self.collision_mask_origin = None
+
+        self.chunk_grid = None
+        self.chunks = None
+        self.chunks_version = 0
+        self.dirty_region = DirtyRegion()
+
+    def get_size(self) -> tuple[int, int]:
+        """Get the size of the map in pixels."""
+        return (self.width * self.tile_size, self.height * self.tile_size)
+
+    def get_world_rect(self) -> pygame.Rect:
+        """Get the rect of the world, the map with the map offset as margin around it."""
+        width, height = self.get_size()
+        return pygame.Rect(
+            0, 0, width + Settings.MAP_OFFSET * 2, height + Settings.MAP_OFFSET * 2
+        )
+
+    def build_chunks(self):
+        """Bucket the ground, road and object tiles in chunks, every chunk is rendered onto its own surface.
+        Tiles crossing a chunk border are added to every chunk they overlap, in layer order."""
+        self.chunk_grid = SpatialGrid(
+            Settings.MAP_CHUNK_SIZE * self.tile_size,
+            Position((Settings.MAP_OFFSET, Settings.MAP_OFFSET)),
+        )
+        self.chunks = {}
+
+        for tile in self.ground + self.road + self.objects:
+            tile.opacity = 255
+            sprite, offset = tile.get_sprite()
+            rect = pygame.Rect(
+                tile.position.get_absolute_pos() + offset, sprite.get_size()
+            )
+
+            for cell in self.chunk_grid.get_cells(rect):
+                if cell not in self.chunks:
+                    self.chunks[cell] = SimpleNamespace(
+                        cell_rect=self.get_cell_rect(cell),
+                        rect=None,
+                        tiles=[],
+                        surface=None,
+                        opacity=None,
+                    )
+
+                chunk = self.chunks[cell]
+                tile_rect = rect.clip(chunk.cell_rect)
+                chunk.rect = tile_rect if chunk.rect is None else chunk.rect.union(tile_rect)
+                chunk.tiles.append(tile)
+
+    def get_cell_rect(self, cell: tuple[int, int]) -> pygame.Rect:
+        """Get the world rect of a chunk cell."""
+        size = self.chunk_grid.cell_size
+        origin_x, origin_y = self.chunk_grid.origin.get_pos()
+        return pygame.Rect(origin_x + cell[0] * size, origin_y + cell[1] * size, size, size)
+
+    def build_collision_grid(self):
+        """Bucket the road and object tiles in a grid, so collisions are only checked against nearby tiles."""
+        self.collision_grid = SpatialGrid(
+            self.tile_size, Position((Settings.MAP_OFFSET, Settings.MAP_OFFSET))
+        )
+
+        for tile in self.road + self.objects:
+            mask, offset, _ = tile.get_mask()
+            if mask is None:
+                continue
+
+            position = Position(tile.position.get_absolute_pos() + offset)
+            rect = pygame.Rect(position.get_pos(), mask.get_size())
+            self.collision_grid.insert((tile, mask, position), rect)
+
+    def build_collision_mask(self):
+        """Composite the masks of the road and object tiles into one mask, tiles never move after loading."""
+        tiles = []
+        for tile in self.road + self.objects:
+            mask, offset, _ = tile.get_mask()
+            if mask is not None:
+                tiles.append((mask, tile.position.get_absolute_pos() + offset))
+
+        if not tiles:
+            self.collision_mask = pygame.mask.Mask((0, 0))
+            self.collision_mask_origin = Position((0, 0))
+            return
+
+        bounds = pygame.Rect(tiles[0][1], tiles[0][0].get_size()).unionall(
+            [pygame.Rect(position, mask.get_size()) for mask, position in tiles]
+        )
+        self.collision_mask = pygame.mask.Mask(bounds.size)
+        self.collision_mask_origin = Position(bounds.topleft)
+
+        for mask, position in tiles:
+            self.collision_mask.draw(
+                mask, (int(position[0]) - bounds.x, int(position[1]) - bounds.y)
+            )
+
     def get_start_positions(self, amount: int) -> list[tuple[Position, Direction]]:
         """Get the starting positions for an amount players."""
 
         centerpoint = self.checkpoints[0] + Position(
-            (Settings.TILE_SIZE // 2, Settings.TILE_SIZE // 2)
+            (self.tile_size // 2, self.tile_size // 2)
         )
         direction = self.get_direction(self.checkpoints[0], self.checkpoints[1])
 
@@ -84,13 +200,62 @@ class Map:
         """Update the component and all its children"""
         return
 
-    def draw(self, screen, opacity: int = 255):
-        """Draw the map."""
-        for tile in self.ground:
-            tile.draw(screen, opacity)
+    def draw(self, screen, opacity: int = 255, camera: Camera = None):
+        """Draw the chunks of the map that are in view, each chunk is rendered once and drawn with a single blit.
+        Without a camera the world is drawn onto the screen as is."""
+        if self.chunks is None:
+            self.build_chunks()
+
+        view = camera.get_view_rect() if camera is not None else screen.get_rect()
+        offset_x, offset_y = camera.get_offset() if camera is not None else (0, 0)
+        opacity_bucket = Helper.get_opacity_bucket(opacity)
+
+        for chunk in self.get_visible_chunks(view):
+            if chunk.surface is None:
+                self.render_chunk(chunk)
+
+            # Only touch the surface alpha when the opacity moves to another bucket
+            if opacity_bucket != chunk.opacity:
+                # Full opacity clears the alpha, blending at 255 is much slower than a plain blit
+                chunk.surface.set_alpha(opacity_bucket if opacity_bucket < 255 else None)
+                chunk.opacity = opacity_bucket
+
+            screen.blit(chunk.surface, (chunk.rect.x + offset_x, chunk.rect.y + offset_y))
+
+    def get_visible_chunks(self, view: pygame.Rect) -> list[SimpleNamespace]:
+        """Get the chunks overlapping the view, only the cells in view are visited."""
+        return [
+            self.chunks[cell]
+            for cell in self.chunk_grid.get_cells(view)
+            if cell in self.chunks and self.chunks[cell].rect.colliderect(view)
+        ]
+
+    def render_chunk(self, chunk: SimpleNamespace):
+        """Render the tiles of a chunk onto its own off-screen surface."""
+        chunk.surface = pygame.Surface(chunk.rect.size).convert()
+        chunk.opacity = None
+
+        for tile in chunk.tiles:
+            tile.draw(chunk.surface, 255, (-chunk.rect.x, -chunk.rect.y))
+
+    def get_dirty_rects(self, camera: Camera = None):
+        """Return the visible map rect when the chunks were invalidated or the camera moved, the map is static otherwise."""
+        if self.chunks is None:
+            self.build_chunks()
+
+        width, height = self.get_size()
+        rect = pygame.Rect(Settings.MAP_OFFSET, Settings.MAP_OFFSET, width, height)
+        if camera is not None:
+            rect = rect.move(camera.get_offset()).clip(camera.viewport)
+            state = (self.chunks_version, camera.position.get_pos())
+        else:
+            state = (self.chunks_version, None)
 
-        for tile in self.road:
-            tile.draw(screen, opacity)
+        return self.dirty_region.update(state, rect)
 
-        for tile in self.objects:
-            tile.draw(screen, opacity)
+    def invalidate_layers(self):
+        """Throw away the rendered chunks, they are rendered again when they are drawn."""
+        if self.chunks is not None:
+            for chunk in self.chunks.values():
+                chunk.surface = None
+        self.chunks_version += 1
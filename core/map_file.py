@@ -0,0 +1,111 @@
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+
+
+class MapFile:
+    """Binary map file, a header followed by the layers as packed little-endian int16 tile ids.
+    The header holds the dimensions in tiles, the tile size, the layer count and the map name."""
+
+    MAGIC = b"RMAP"
+    VERSION = 1
+    EXTENSION = ".rmap"
+    HEADER = struct.Struct("<4sHHHHHH")  # magic, version, width, height, tile size, layer count, name length
+    LAYERS = ("ground", "road", "objects", "checkpoints")
+    TILE = array("h").itemsize
+
+    @classmethod
+    def read_header(cls, file) -> SimpleNamespace:
+        """Read the header from the start of an open file."""
+        magic, version, width, height, tile_size, layer_count, name_length = (
+            cls.HEADER.unpack(file.read(cls.HEADER.size))
+        )
+        if magic != cls.MAGIC:
+            raise ValueError(f"{file.name} is not a map file")
+        if version != cls.VERSION:
+            raise ValueError(f"{file.name} has unsupported map version {version}")
+        if layer_count != len(cls.LAYERS):
+            raise ValueError(f"{file.name} has {layer_count} layers, expected {len(cls.LAYERS)}")
+
+        return SimpleNamespace(
+            name=file.read(name_length).decode("utf-8"),
+            width=width,
+            height=height,
+            tile_size=tile_size,
+            layers=cls.LAYERS,
+        )
+
+    @classmethod
+    def read_rows(cls, file, header: SimpleNamespace):
+        """Stream the rows of every layer after the header, yields the layer name, row index and the row of tile ids.
+        Only one row is held in memory at a time, a row is only valid until the next one is read."""
+        row_size = header.width * cls.TILE
+        buffer = bytearray(row_size)
+        for layer in header.layers:
+            for row_index in range(header.height):
+                if file.readinto(buffer) != row_size:
+                    raise ValueError(f"{file.name} ends in the {layer} layer")
+                yield (layer, row_index, cls.to_tiles(buffer))
+
+    @classmethod
+    def read(cls, file_path: Path) -> dict:
+        """Read a whole map file into a dictionary with the header fields and the layers."""
+        with open(file_path, "rb") as file:
+            header = cls.read_header(file)
+            layers = {layer: array("h") for layer in header.layers}
+            for layer, _, row in cls.read_rows(file, header):
+                layers[layer].extend(row)
+
+        return {
+            "name": header.name,
+            "width": header.width,
+            "height": header.height,
+            "tile_size": header.tile_size,
+            **layers,
+        }
+
+    @classmethod
+    def write(cls, file_path: Path, name: str, width: int, height: int, tile_size: int, layers: dict):
+        """Write a map file, every layer must hold width times height tile ids."""
+        encoded_name = name.encode("utf-8")
+        with open(file_path, "wb") as file:
+            file.write(
+                cls.HEADER.pack(
+                    cls.MAGIC, cls.VERSION, width, height, tile_size, len(cls.LAYERS), len(encoded_name)
+                )
+            )
+            file.write(encoded_name)
+
+            for layer in cls.LAYERS:
+                if len(layers[layer]) != width * height:
+                    raise ValueError(f"the {layer} layer of {name} is not {width}x{height} tiles")
+
+                tiles = array("h", layers[layer])
+                if sys.byteorder == "big":
+                    tiles.byteswap()
+                file.write(tiles.tobytes())
+
+    @classmethod
+    def convert_json(cls, json_path: Path, tile_size: int, width: int = 14) -> Path:
+        """Convert a JSON map to a map file next to it, JSON maps without a width are 14 tiles wide."""
+        with open(json_path, "r") as f:
+            data = json.load(f)
+
+        width = data.get("width", width)
+        height = len(data["ground"]) // width
+        file_path = Path(json_path).with_suffix(cls.EXTENSION)
+        cls.write(file_path, data["name"], width, height, tile_size, data)
+        return file_path
+
+    @classmethod
+    def to_tiles(cls, data) -> memoryview | array:
+        """View little-endian int16 bytes as tile ids, big-endian machines get a swapped copy."""
+        if sys.byteorder == "little":
+            return memoryview(data).cast("h")
+
+        tiles = array("h", bytes(data))
+        tiles.byteswap()
+        return tiles
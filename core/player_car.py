@@ -17,23 +17,16 @@ class PlayerCar(Car):
         controls: CarControls,
         position: Position,
         properties: CarProperties,
+        font_service=None,
     ):
-        super().__init__(name, image, position, properties)
+        super().__init__(name, image, position, properties, font_service)
         self.controls = controls
 
-    def update(self, delta_time: float, input_state: InputState):
+    def read_input(self, input_state: InputState):
+        """Read the directions from the keys of the player's controls."""
         keys = input_state.cur_keyboard_state
-
-        if keys[self.controls.get_key(Direction.UP)]:
-            self.handle_controls(Direction.UP)
-        elif keys[self.controls.get_key(Direction.DOWN)]:
-            self.handle_controls(Direction.DOWN)
-        else:
-            self.apply_drag()
-
-        if keys[self.controls.get_key(Direction.LEFT)]:
-            self.handle_controls(Direction.LEFT)
-        elif keys[self.controls.get_key(Direction.RIGHT)]:
-            self.handle_controls(Direction.RIGHT)
-
-        super().update(delta_time, input_state)
+        self.input = [
+            direction
+            for direction in (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+            if keys[self.controls.get_key(direction)]
+        ]
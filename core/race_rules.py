@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+import math
+import pygame
+from core.car import Car
+from core.event_handler import EventHandler
+from core.map import Map
+from settings import Settings
+
+
+class RaceRules:
+    """Tracks the checkpoints, laps and places of the cars in a race.
+    Crossing the first checkpoint starts a lap, reaching it again after all other checkpoints completes one."""
+
+    def __init__(self, map: Map, laps: int = Settings.RACE_LAPS):
+        self.map = map
+        self.laps = laps
+        self.checkpoints = [
+            pygame.Rect(position.get_pos(), (map.tile_size, map.tile_size))
+            for position in map.checkpoints.values()
+        ]
+        self.elapsed = 0.0
+        self.progress = {}
+
+        # Create events
+        self.events = SimpleNamespace()
+        self.events.on_checkpoint_passed = EventHandler()
+        self.events.on_lap_completed = EventHandler()
+        self.events.on_race_finished = EventHandler()
+
+    def get_progress(self, car: Car) -> SimpleNamespace:
+        """Get the progress of a car, created when the car is first seen."""
+        if car not in self.progress:
+            self.progress[car] = SimpleNamespace(
+                next_checkpoint=0,
+                passed=0,
+                lap_started=None,
+                lap_times=[],
+                finished=False,
+                finish_time=None,
+            )
+        return self.progress[car]
+
+    def update(self, players: list[Car], timedelta: float):
+        """Advance the race clock, check the checkpoints of every car and update the places."""
+        self.elapsed += timedelta
+
+        for car in players:
+            self.update_checkpoints(car)
+
+        for place, car in enumerate(sorted(players, key=self.get_standing), 1):
+            car.place = place
+
+    def update_checkpoints(self, car: Car):
+        """Move a car on to its next checkpoint when it reached it."""
+        progress = self.get_progress(car)
+        if progress.finished or not self.checkpoints:
+            return
+
+        if not self.checkpoints[progress.next_checkpoint].collidepoint(
+            car.position.get_pos()
+        ):
+            return
+
+        if progress.next_checkpoint == 0:
+            if progress.lap_started is not None:
+                self.complete_lap(car, progress)
+            if not progress.finished:
+                progress.lap_started = self.elapsed
+                car.lap += 1
+
+        self.events.on_checkpoint_passed.notify(car, progress.next_checkpoint)
+        progress.passed += 1
+        progress.next_checkpoint = (progress.next_checkpoint + 1) % len(
+            self.checkpoints
+        )
+
+    def complete_lap(self, car: Car, progress: SimpleNamespace):
+        """Record the lap time of a car, the car finishes after its last lap."""
+        lap_time = self.elapsed - progress.lap_started
+        progress.lap_times.append(lap_time)
+        self.events.on_lap_completed.notify(car, len(progress.lap_times), lap_time)
+
+        if len(progress.lap_times) >= self.laps:
+            progress.finished = True
+            progress.finish_time = self.elapsed
+            self.events.on_race_finished.notify(car)
+
+    def get_standing(self, car: Car) -> tuple:
+        """Sort key for the places, finished cars first in finishing order, then the most checkpoints passed and closest to the next."""
+        progress = self.get_progress(car)
+        if progress.finished:
+            return (0, progress.finish_time, 0, 0)
+        if not self.checkpoints:
+            return (1, 0, 0, 0)
+
+        distance = math.dist(
+            car.position.get_pos(), self.checkpoints[progress.next_checkpoint].center
+        )
+        return (1, 0, -progress.passed, distance)
+
+    def get_results(self, players: list[Car]) -> list[dict]:
+        """Get the result of every car in order of place, with its lap times, penalties and collisions.
+        The player is the index of the car in the players."""
+        return [
+            {
+                "player": players.index(car),
+                "name": car.name,
+                "place": car.place,
+                "finished": self.get_progress(car).finished,
+                "finish_time": self.get_progress(car).finish_time,
+                "lap_times": list(self.get_progress(car).lap_times),
+                "penalties": car.penalties,
+                "collisions": car.collisions,
+            }
+            for car in sorted(players, key=self.get_standing)
+        ]
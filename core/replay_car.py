@@ -0,0 +1,28 @@
+from core.car import Car
+from core.car_properties import CarProperties
+from core.input_state import InputState
+from core.position import Position
+from core.replay_input import ReplayInput
+from core.sprites.sprite import Sprite
+
+
+class ReplayCar(Car):
+    """Class for handeling a car driven by a recorded player, the input is read from a replay."""
+
+    def __init__(
+        self,
+        name: str,
+        sprite: Sprite,
+        position: Position,
+        properties: CarProperties,
+        replay_input: ReplayInput,
+        player: int,
+        font_service=None,
+    ):
+        super().__init__(name, sprite, position, properties, font_service)
+        self.replay_input = replay_input
+        self.player = player
+
+    def read_input(self, input_state: InputState):
+        """Read the directions the recorded player steered in at this tick."""
+        self.input = list(self.replay_input.get_input(self.player))
@@ -0,0 +1,127 @@
+import struct
+from types import SimpleNamespace
+from core.enums.direction import Direction
+
+
+class ReplayFile:
+    """Binary replay file, a header describing the race followed by the input of the recorded players.
+    The header holds the seed, timedelta, laps, whether AI cars drive, the map and the car option and name of every recorded player.
+    Input is only stored when it changes, as the ticks since the previous change followed by the packed input."""
+
+    MAGIC = b"RREP"
+    VERSION = 2
+    EXTENSION = ".rrep"
+    HEADER = struct.Struct("<4sHQdH?HH")  # magic, version, seed, timedelta, laps, AI drivers, player count, map name length
+    PLAYER = struct.Struct("<BH")  # car option index, name length
+    DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+    @classmethod
+    def read_header(cls, file) -> SimpleNamespace:
+        """Read the header from the start of an open file."""
+        magic, version, seed, timedelta, laps, ai_drivers, player_count, map_name_length = (
+            cls.HEADER.unpack(file.read(cls.HEADER.size))
+        )
+        if magic != cls.MAGIC:
+            raise ValueError(f"{file.name} is not a replay file")
+        if version != cls.VERSION:
+            raise ValueError(f"{file.name} has unsupported replay version {version}")
+
+        map_name = file.read(map_name_length).decode("utf-8")
+        players = []
+        for _ in range(player_count):
+            car_option, name_length = cls.PLAYER.unpack(file.read(cls.PLAYER.size))
+            players.append((car_option, file.read(name_length).decode("utf-8")))
+
+        return SimpleNamespace(
+            seed=seed,
+            timedelta=timedelta,
+            laps=laps,
+            ai_drivers=ai_drivers,
+            map_name=map_name,
+            players=players,
+        )
+
+    @classmethod
+    def write_header(
+        cls,
+        file,
+        seed: int,
+        timedelta: float,
+        laps: int,
+        ai_drivers: bool,
+        map_name: str,
+        players: list[tuple[int, str]],
+    ):
+        """Write the header to an open file, the players are the car option index and name of every recorded player."""
+        encoded_map_name = map_name.encode("utf-8")
+        file.write(
+            cls.HEADER.pack(
+                cls.MAGIC, cls.VERSION, seed, timedelta, laps, ai_drivers, len(players), len(encoded_map_name)
+            )
+        )
+        file.write(encoded_map_name)
+
+        for car_option, name in players:
+            encoded_name = name.encode("utf-8")
+            file.write(cls.PLAYER.pack(car_option, len(encoded_name)))
+            file.write(encoded_name)
+
+    @classmethod
+    def write_record(cls, file, ticks: int, packed_input: bytes):
+        """Write the input of the players, the ticks since the previous record are stored as a varint."""
+        varint = bytearray()
+        while ticks >= 0x80:
+            varint.append((ticks & 0x7F) | 0x80)
+            ticks >>= 7
+        varint.append(ticks)
+        file.write(varint + packed_input)
+
+    @classmethod
+    def read_records(cls, file, header: SimpleNamespace):
+        """Stream the records after the header, yields the ticks since the previous record and the packed input.
+        A record cut off at the end of the file, from a recording that was not closed, ends the stream."""
+        input_size = cls.get_input_size(len(header.players))
+        while True:
+            ticks = 0
+            shift = 0
+            while True:
+                byte = file.read(1)
+                if not byte:
+                    return
+                ticks |= (byte[0] & 0x7F) << shift
+                shift += 7
+                if byte[0] < 0x80:
+                    break
+
+            packed_input = file.read(input_size)
+            if len(packed_input) != input_size:
+                return
+            yield (ticks, packed_input)
+
+    @classmethod
+    def get_input_size(cls, player_count: int) -> int:
+        """Get the bytes the input of a tick takes, every player takes four bits."""
+        return (player_count + 1) // 2
+
+    @classmethod
+    def pack_input(cls, inputs: list[list[Direction]]) -> bytes:
+        """Pack the directions of every player into four bits, two players share a byte."""
+        packed_input = bytearray(cls.get_input_size(len(inputs)))
+        for index, directions in enumerate(inputs):
+            bits = 0
+            for bit, direction in enumerate(cls.DIRECTIONS):
+                if direction in directions:
+                    bits |= 1 << bit
+            packed_input[index // 2] |= bits << (index % 2 * 4)
+        return bytes(packed_input)
+
+    @classmethod
+    def unpack_input(cls, packed_input: bytes, player_count: int) -> list[list[Direction]]:
+        """Unpack the directions of every player."""
+        inputs = []
+        for index in range(player_count):
+            bits = packed_input[index // 2] >> (index % 2 * 4)
+            inputs.append(
+                [direction for bit, direction in enumerate(cls.DIRECTIONS) if bits & (1 << bit)]
+            )
+        return inputs
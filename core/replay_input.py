@@ -0,0 +1,59 @@
+from pathlib import Path
+from core.enums.direction import Direction
+from core.replay_file import ReplayFile
+
+
+class ReplayInput:
+    """Reads the input of the recorded players back from a replay file, advancing a tick every time the input was read."""
+
+    def __init__(self, file_path: Path):
+        self.file = open(file_path, "rb")
+        self.header = ReplayFile.read_header(self.file)
+        self.records = ReplayFile.read_records(self.file, self.header)
+
+        self.tick = 0
+        self.inputs = [[] for _ in self.header.players]
+        self.record_tick = 0
+        self.end_tick = 0
+        self.next_inputs = None
+
+        self.read_record()
+        self.apply_records()
+
+    def get_input(self, player: int) -> list[Direction]:
+        """Get the directions a recorded player steers in at the current tick."""
+        return self.inputs[player]
+
+    def is_finished(self) -> bool:
+        """Return whether the tick the recording ended at is reached."""
+        return self.next_inputs is None and self.tick >= self.end_tick
+
+    def read_record(self):
+        """Read the next record, the file is closed after the last one."""
+        record = next(self.records, None)
+        if record is None:
+            self.next_inputs = None
+            self.file.close()
+            return
+
+        ticks, packed_input = record
+        self.record_tick += ticks
+        self.next_inputs = ReplayFile.unpack_input(packed_input, len(self.header.players))
+
+    def apply_records(self):
+        """Apply the records that are due at the current tick."""
+        while self.next_inputs is not None and self.record_tick <= self.tick:
+            self.inputs = self.next_inputs
+            self.end_tick = self.record_tick
+            self.read_record()
+
+    # ------------------------------
+    # Event handlers
+    # ------------------------------
+    def handle_stage_completed(self, stage, seconds):
+        """Handle the race stage completed event, the next tick starts after the input was read."""
+        if stage != "input":
+            return
+
+        self.tick += 1
+        self.apply_records()
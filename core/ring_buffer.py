@@ -0,0 +1,35 @@
+from array import array
+
+
+class RingBuffer:
+    """Fixed-size buffer of floats, once full every new value replaces the oldest one."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.buffer = array("d", [0.0] * size)
+        self.index = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value: float):
+        """Add a value, overwriting the oldest value when the buffer is full."""
+        self.buffer[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def values(self) -> list[float]:
+        """Return the values from oldest to newest."""
+        if self.count < self.size:
+            return self.buffer[: self.count].tolist()
+        return (self.buffer[self.index :] + self.buffer[: self.index]).tolist()
+
+    def get_percentile(self, percentile: float) -> float:
+        """Return the value below which the given percentage of the values fall, 0 when empty."""
+        if self.count == 0:
+            return 0.0
+
+        values = sorted(self.values())
+        index = min(int(len(values) * percentile / 100), len(values) - 1)
+        return values[index]
@@ -1,3 +1,4 @@
+import math
 from injector import inject
 import pygame
 from core.position import Position
@@ -12,11 +13,8 @@ class CollisionService(ServiceBase):
         super().__init__(settings)
         self.services.logger = log_service
 
-    def update(self, timedelta, input_state, map, players):
-        # Calculate the move of objects that move, such as cars.
-        # Calculate them against objects that are not itself.
-
-        # Initialize collisions dictionary
+    def detect(self, map, players) -> dict:
+        """Find what every player collides with, returns a list of collided objects for each player."""
         collisions = {player: [] for player in players}
 
         # Check collision against other players
@@ -26,9 +24,7 @@ class CollisionService(ServiceBase):
         # Check collision against road and objects
         self.check_road_objects_collision(map, players, collisions)
 
-        # After all collisions are checked, move the cars
-        for player, collision_objs in collisions.items():
-            player.move(timedelta, collision_objs)
+        return collisions
 
     def check_players_collision(self, players, collisions):
         for i in range(len(players)):
@@ -47,14 +43,21 @@ class CollisionService(ServiceBase):
 
     def check_road_objects_collision(self, map, players, collisions):
         for player in players:
-            for sprite_obj in map.road + map.objects:
-                sprite_player = player.sprite
-                mask_player, offset_player, _ = sprite_player.get_mask()
-                pos_player = Position(sprite_player.position.get_absolute_pos() + offset_player)
+            sprite_player = player.sprite
+            mask_player, offset_player, _ = sprite_player.get_mask()
+            x, y = sprite_player.position.get_absolute_pos() + offset_player
+            pos_player = Position((math.floor(x), math.floor(y)))
+
+            # A single test against the static geometry, most frames have no collision at all
+            if not map.collision_mask.overlap(
+                mask_player, pos_player.get_offset_between_pos(map.collision_mask_origin)
+            ):
+                continue
 
-                mask_obj, offset_obj, _ = sprite_obj.get_mask()
-                pos_obj = Position(sprite_obj.position.get_absolute_pos() + offset_obj)
+            # Only check the tiles in the grid cells below the player to find what was hit
+            rect_player = pygame.Rect(pos_player.get_pos(), mask_player.get_size())
 
+            for sprite_obj, mask_obj, pos_obj in map.collision_grid.query(rect_player):
                 if mask_player.overlap(mask_obj, pos_obj.get_offset_between_pos(pos_player)):
                     # Collision detected, add to collisions dict
                     collisions[player].append(sprite_obj)
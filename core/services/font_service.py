@@ -0,0 +1,27 @@
+from injector import inject
+import pygame
+from core.services.log_service import LogService
+from core.services.service_base import ServiceBase
+from core.enums.log_level import LogLevel
+from settings import Settings
+
+
+class FontService(ServiceBase):
+    """Service for sharing fonts, a font is only loaded once for every face and size."""
+
+    @inject
+    def __init__(self, log_service: LogService, settings: Settings):
+        super().__init__(settings)
+        self.services.logger = log_service
+        self.fonts = {}
+
+    def get_font(self, face: str | None, size: int) -> pygame.font.Font:
+        """Get the shared font for a face and size, None is pygame's default font."""
+        key = (face, size)
+        if key not in self.fonts:
+            self.services.logger.log(
+                f"Loading [Font]: {face or 'default'} ({size})", LogLevel.DEBUG
+            )
+            self.fonts[key] = pygame.font.Font(face, size)
+
+        return self.fonts[key]
@@ -1,9 +1,12 @@
 import json
 import os
-from anyio import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from core.enums.log_level import LogLevel
 from core.enums.sprite_type import SpriteType
 from injector import inject
 from core.map import Map
+from core.map_file import MapFile
 from core.enums.tile_type import TileType
 from core.position import Position
 from core.services.log_service import LogService
@@ -22,42 +25,119 @@ class MapService(ServiceBase):
         self.services.sprite = sprite_service
         self.maps_root = Path(__file__).parents[2] / "assets" / "maps"
 
-        self.maps = None
+        # Maps are only loaded when they are needed, or prefetched on the background thread
+        self.map_files = self.index_maps()
+        self.maps = {}
+        self.prefetches: dict[str, Future] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="map_prefetch"
+        )
+
+    def get_map_names(self) -> list[str]:
+        """Get the names of all the maps, without loading them."""
+        return list(self.map_files.keys())
 
     def get_map(self, map_name: str):
-        """Get a map by name."""
-        if self.maps is None:
-            self.load_maps()
+        """Get a map by name, it is loaded on first use or waits for its prefetch to finish.
+        The chunks are built here, they render surfaces in the display format so they need the main thread."""
+        if map_name not in self.maps:
+            if map_name in self.prefetches:
+                map = self.prefetches.pop(map_name).result()
+            else:
+                map = self.load_map(self.map_files[map_name])
+
+            map.build_chunks()
+            self.maps[map_name] = map
 
         return self.maps[map_name]
 
-    def load_maps(self):
-        """Load all the maps."""
-        maps = {}
-        for map_file in os.listdir(self.maps_root):
+    def prefetch_map(self, map_name: str):
+        """Start loading a map on the background thread, so it is ready when it is needed.
+        The sheets of the tiles are loaded here first, the background thread only slices sprites from them."""
+        if map_name in self.maps or map_name in self.prefetches:
+            return
+
+        self.services.sprite.load_spritesheets([SpriteType.TILE, SpriteType.OBJECT])
+        self.services.logger.log(f"Prefetching [Map]: {map_name}", LogLevel.DEBUG)
+        self.prefetches[map_name] = self.executor.submit(
+            self.load_map, self.map_files[map_name]
+        )
+
+    def index_maps(self) -> dict[str, Path]:
+        """Index the map files by their map name, binary map files take precedence over JSON maps."""
+        map_files = {}
+        for map_file in sorted(os.listdir(self.maps_root)):
             map_file = self.maps_root / map_file
-            map_name = map_file.stem.split(".")[0]
-            maps[map_name] = self.load_map(map_file)
-        self.maps = maps
+            map_name = map_file.name.split(".")[0]
+            if map_name not in map_files or map_file.suffix == MapFile.EXTENSION:
+                map_files[map_name] = map_file
+        return map_files
 
     def load_map(self, map_file: Path) -> Map:
-        """Load a map from a file."""
+        """Load a map from a binary map file, or a JSON file, with its collision grid and mask.
+        Loading doesn't touch the display once the tile sheets are loaded, so it is safe to call on the background thread."""
+        self.services.logger.log(f"Loading [Map]: {map_file.name}", LogLevel.DEBUG)
+        if map_file.suffix == MapFile.EXTENSION:
+            map = self.load_binary_map(map_file)
+        else:
+            map = self.load_json_map(map_file)
+
+        map.build_collision_grid()
+        map.build_collision_mask()
+
+        return map
+
+    def load_json_map(self, map_file: Path) -> Map:
+        """Load a map from a JSON file, the layers are parsed whole."""
         map = None
         with open(map_file, "r") as f:
             map = Map(**json.load(f))
 
-        map.ground = self.convert_to_layer(TileType.GROUND, map.ground)
-        map.road = self.convert_to_layer(TileType.ROAD, map.road)
-        map.objects = self.convert_to_layer(TileType.OBJECT, map.objects)
-        map.checkpoints = self.convert_to_checkpoints(map.checkpoints)
+        map.ground = self.convert_to_layer(TileType.GROUND, map.ground, map)
+        map.road = self.convert_to_layer(TileType.ROAD, map.road, map)
+        map.objects = self.convert_to_layer(TileType.OBJECT, map.objects, map)
+        map.checkpoints = self.convert_to_checkpoints(map.checkpoints, map)
 
         return map
 
-    def convert_to_layer(self, tile_type: TileType, layer: list):
-        """Convert a layer to a layer with sprites."""
+    def load_binary_map(self, map_file: Path) -> Map:
+        """Load a map from a binary map file, the layers are streamed and converted one row at a time."""
+        with open(map_file, "rb") as file:
+            header = MapFile.read_header(file)
+            map = Map(
+                header.name, [], [], [], {}, header.width, header.height, header.tile_size
+            )
+
+            for layer, row_index, row in MapFile.read_rows(file, header):
+                first_index = row_index * map.width
+                match layer:
+                    case "ground":
+                        map.ground += self.convert_to_layer(
+                            TileType.GROUND, row, map, first_index
+                        )
+                    case "road":
+                        map.road += self.convert_to_layer(
+                            TileType.ROAD, row, map, first_index
+                        )
+                    case "objects":
+                        map.objects += self.convert_to_layer(
+                            TileType.OBJECT, row, map, first_index
+                        )
+                    case "checkpoints":
+                        map.checkpoints |= self.convert_to_checkpoints(
+                            row, map, first_index
+                        )
+
+        map.checkpoints = {k: map.checkpoints[k] for k in sorted(map.checkpoints)}
+        return map
+
+    def convert_to_layer(
+        self, tile_type: TileType, layer, map: Map, first_index: int = 0
+    ):
+        """Convert a layer, or some rows of it starting at the first index, to a layer with sprites."""
         result = []
 
-        for index, tile_id in enumerate(layer):
+        for index, tile_id in enumerate(layer, first_index):
             if tile_id == -1:
                 continue
 
@@ -69,30 +149,29 @@ class MapService(ServiceBase):
                     sprite_type = SpriteType.OBJECT
 
             tile = self.services.sprite.get_sprite_from(sprite_type, tile_id)
-            tile.position = Position(
-                (
-                    Settings.MAP_OFFSET + (index % 14) * 128,
-                    Settings.MAP_OFFSET + (index // 14) * 128,
-                )
-            )
+            tile.position = self.get_tile_position(map, index)
 
             result.append(tile)
 
         return result
 
-    def convert_to_checkpoints(self, layer: list):
-        """Convert a layer to a layer with sprites."""
+    def convert_to_checkpoints(self, layer, map: Map, first_index: int = 0):
+        """Convert a layer, or some rows of it starting at the first index, to checkpoint positions."""
         checkpoints = {}
 
-        for index, checkpoint_id in enumerate(layer):
+        for index, checkpoint_id in enumerate(layer, first_index):
             if checkpoint_id == -1:
                 continue
 
-            checkpoints[checkpoint_id] = Position(
-                (
-                    Settings.MAP_OFFSET + (index % 14) * 128,
-                    Settings.MAP_OFFSET + (index // 14) * 128,
-                )
-            )
+            checkpoints[checkpoint_id] = self.get_tile_position(map, index)
 
         return {k: checkpoints[k] for k in sorted(checkpoints)}
+
+    def get_tile_position(self, map: Map, index: int) -> Position:
+        """Get the position of the tile at an index of a layer."""
+        return Position(
+            (
+                Settings.MAP_OFFSET + (index % map.width) * map.tile_size,
+                Settings.MAP_OFFSET + (index // map.width) * map.tile_size,
+            )
+        )
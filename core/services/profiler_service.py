@@ -0,0 +1,49 @@
+import time
+from injector import inject
+from core.ring_buffer import RingBuffer
+from core.services.service_base import ServiceBase
+from settings import Settings
+
+
+class ProfilerService(ServiceBase):
+    """Service for recording how long every stage of a frame takes.
+    Stages recorded several times in a frame are added up, every frame adds one sample per stage to its ring buffer."""
+
+    @inject
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.samples = {}
+        self.current = {}
+
+    def record(self, name: str, seconds: float):
+        """Add time spent on a stage in the current frame."""
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def measure(self, name: str, function, *args):
+        """Call a function and record the time it took, returns the result of the function."""
+        start = time.perf_counter()
+        result = function(*args)
+        self.record(name, time.perf_counter() - start)
+        return result
+
+    def end_frame(self):
+        """Store the stage times of the frame in their ring buffers and start a new frame."""
+        for name, seconds in self.current.items():
+            if name not in self.samples:
+                self.samples[name] = RingBuffer(Settings.PROFILER_SAMPLES)
+            self.samples[name].append(seconds)
+        self.current = {}
+
+    def get_percentiles(self, name: str) -> tuple[float, float, float]:
+        """Get the p50, p95 and p99 of a stage in milliseconds."""
+        samples = self.samples.get(name)
+        if samples is None:
+            return (0.0, 0.0, 0.0)
+        return tuple(samples.get_percentile(p) * 1000 for p in (50, 95, 99))
+
+    def get_history(self, name: str) -> list[float]:
+        """Get the recorded times of a stage in milliseconds, from oldest to newest."""
+        samples = self.samples.get(name)
+        if samples is None:
+            return []
+        return [seconds * 1000 for seconds in samples.values()]
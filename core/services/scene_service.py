@@ -3,15 +3,16 @@ from injector import inject
 from types import SimpleNamespace
 
 import pygame
-from core.components.label_component import LabelComponent
-from core.enums.alignment import Alignment
+from core.components.profiler_overlay import ProfilerOverlay
 from core.enums.log_level import LogLevel
 from core.enums.scene import Scene
 from core.event_handler import EventHandler
 from core.position import Position
 from core.services.collision_service import CollisionService
+from core.services.font_service import FontService
 from core.services.log_service import LogService
 from core.services.map_service import MapService
+from core.services.profiler_service import ProfilerService
 from core.services.service_base import ServiceBase
 from core.services.sound_service import SoundService
 from core.services.sprite_service import SpriteService
@@ -32,6 +33,8 @@ class SceneService(ServiceBase):
         sound_service: SoundService,
         map_service: MapService,
         collision_service: CollisionService,
+        font_service: FontService,
+        profiler_service: ProfilerService,
         settings: Settings,
         screen: pygame.Surface,
     ):
@@ -41,17 +44,20 @@ class SceneService(ServiceBase):
         self.services.sound = sound_service
         self.services.map = map_service
         self.services.collision = collision_service
+        self.services.font = font_service
+        self.services.profiler = profiler_service
         self.services.scene = self
         self.scenes = []
         self.active_scene = None
+        self.full_redraw = True
+        self.interpolation = 1.0
         self.screen = screen
-        self.fps_label = LabelComponent(
-            "fps_label",
-            Position((30, 10)),
-            "",
-            Alignment.CENTER,
-            16,
+        self.profiler_overlay = ProfilerOverlay(
+            "profiler_overlay",
+            Position((10, 10)),
+            self.services.profiler,
             parent=self,
+            font_service=self.services.font,
         )
 
         self.transition = SimpleNamespace(
@@ -81,6 +87,10 @@ class SceneService(ServiceBase):
             Scene.SETTINGSSCENE: SettingsScene(self.screen, self.services),
         }
 
+        self.scenes[Scene.RACESCENE].events.on_stage_completed += (
+            self.handle_stage_completed
+        )
+
     def get_scene(self, scene: Scene):
         """Get a scene by its enum."""
         return self.scenes[scene]
@@ -89,6 +99,7 @@ class SceneService(ServiceBase):
         """Set the active scene."""
         if not self.transition.active and self.active_scene != None:
             self.events.on_scene_changing.notify(next_scene)
+            self.services.sprite.warm_up(self.get_scene(next_scene).warmup_sprites)
             self.get_scene(next_scene).preload()
             self.transition.active = True
             self.transition.next_scene = next_scene
@@ -96,12 +107,15 @@ class SceneService(ServiceBase):
         else:
             self.events.on_scene_changed.notify(next_scene)
             self.active_scene = self.scenes[next_scene]
+            self.full_redraw = True
             self.transition.active = False
             self.transition.next_scene_opacity = 0
             self.transition.next_scene = None
 
     def handle_event(self, event):
         """Handle any non pygame.QUIT event. The event is passed down to the active scene."""
+        self.profiler_overlay.handle_event(event)
+
         if self.transition.active:
             self.get_scene(self.transition.next_scene).handle_event(event)
         elif self.active_scene:
@@ -109,29 +123,65 @@ class SceneService(ServiceBase):
 
     def update(self, timedelta, input_state):
         """Update the game state for all relevant sources."""
-        self.fps_label.text = f"FPS: {1 // timedelta}"
-
         if self.transition.active:
             transition_tick = 255 / (
-                math.floor(Settings.TRANSITION_SPEED * Settings.FPS)
+                math.floor(Settings.TRANSITION_SPEED * Settings.TICK_RATE)
             )
             self.transition.next_scene_opacity += transition_tick
-            self.get_scene(self.transition.next_scene).update(timedelta, input_state)
+            self.measure_scene(
+                "update",
+                self.get_scene(self.transition.next_scene).update,
+                timedelta,
+                input_state,
+            )
             if self.transition.next_scene_opacity >= 255:
                 self.set_active_scene(self.transition.next_scene)
         elif self.active_scene:
-            self.active_scene.update(timedelta, input_state)
+            self.measure_scene(
+                "update", self.active_scene.update, timedelta, input_state
+            )
+
+        self.profiler_overlay.update(timedelta, input_state)
 
     def draw(self, screen):
         """Draw the active screen's components."""
         if self.transition.active:
-            self.get_scene(self.transition.next_scene).draw(
-                self.screen, self.transition.next_scene_opacity
+            self.measure_scene(
+                "draw",
+                self.get_scene(self.transition.next_scene).draw,
+                self.screen,
+                self.transition.next_scene_opacity,
             )
         elif self.active_scene:
-            self.active_scene.draw(self.screen, 255)
+            self.measure_scene("draw", self.active_scene.draw, self.screen, 255)
+
+        self.profiler_overlay.draw(self.screen)
 
-        self.fps_label.draw(self.screen)
+    def measure_scene(self, stage: str, function, *args):
+        """Call a stage of a scene and record its time in the profiler under the stage and scene name."""
+        self.services.profiler.measure(
+            f"{stage} {function.__self__.name}", function, *args
+        )
+
+    def get_dirty_rects(self):
+        """Return the screen rects that changed since the last call, None when the whole screen should be redrawn.
+        Transitions and the first frame of a new scene are always redrawn completely."""
+        dirty_rects = self.profiler_overlay.get_dirty_rects()
+
+        if self.transition.active:
+            # Keep the next scene's regions up to date, the transition redraws everything anyway
+            self.get_scene(self.transition.next_scene).get_dirty_rects()
+            return None
+
+        if self.active_scene is None:
+            return None
+
+        scene_rects = self.active_scene.get_dirty_rects()
+        if self.full_redraw or scene_rects is None:
+            self.full_redraw = False
+            return None
+
+        return scene_rects + dirty_rects
 
     # ------------------------------
     # Event handlers
@@ -144,6 +194,10 @@ class SceneService(ServiceBase):
             LogLevel.INFO,
         )
 
+    def handle_stage_completed(self, stage, seconds):
+        """Handle the race stage completed event, the stages are recorded in the profiler."""
+        self.services.profiler.record(f"race {stage}", seconds)
+
     def handle_scene_changing(self, next_scene):
         """Handle the scene changing event."""
         active_scene_name = self.active_scene.name if self.active_scene else "None"
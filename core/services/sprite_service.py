@@ -1,11 +1,15 @@
 from types import SimpleNamespace
+import threading
 from pathlib import Path
 from injector import inject
 from core.enums.log_level import LogLevel
 from core.enums.sprite_type import SpriteType
 from core.services.log_service import LogService
 from core.services.service_base import ServiceBase
+from core.sprites.asset_cache import AssetCache
+from core.sprites.rotation_atlas import RotationAtlas
 from core.sprites.sprite import Sprite
+from core.sprites.sprite_cache import SpriteCache
 from core.sprites.spritesheet import Spritesheet
 from core.sprites.spritesheet_repository import SpritesheetRepository
 from settings import Settings
@@ -14,25 +18,41 @@ from settings import Settings
 class SpriteService(ServiceBase):
     """Service for handling sprites."""
 
+    SPRITESHEETS = [
+        (SpriteType.VEHICLE, "spritesheet_vehicles.png", 1),
+        (SpriteType.OBJECT, "spritesheet_objects.png", 1),
+        (SpriteType.TILE, "spritesheet_tiles.png", 1),
+        (SpriteType.UI, "greenSheet.png", 0),
+        (SpriteType.UI, "blueSheet.png", 0),
+        (SpriteType.UI, "redSheet.png", 0),
+    ]
+
     @inject
     def __init__(self, log_service: LogService, settings: Settings):
         super().__init__(settings)
         self.services.logger = log_service
         self.spritesheet_root = Path(__file__).parents[2] / "assets" / "sprites"
+        self.asset_cache = None
+        if Settings.ASSET_CACHE:
+            self.asset_cache = AssetCache(Path(__file__).parents[2] / "assets" / ".cache")
+            self.asset_cache.events.on_log_message += self.handle_log_message
 
         self.repository = SpritesheetRepository(
             self.spritesheet_root,
-            [
-                (SpriteType.VEHICLE, "spritesheet_vehicles.png", 1),
-                (SpriteType.OBJECT, "spritesheet_objects.png", 1),
-                (SpriteType.TILE, "spritesheet_tiles.png", 1),
-                (SpriteType.UI, "greenSheet.png", 0),
-                (SpriteType.UI, "blueSheet.png", 0),
-                (SpriteType.UI, "redSheet.png", 0),
-            ],
+            self.SPRITESHEETS,
+            self.asset_cache,
         )
+        self.repository.events.on_log_message += self.handle_log_message
+        self.repository.compile_assets(Settings.SPRITESHEET_DECODE_WORKERS)
+        if Settings.SPRITESHEET_DECODE_WORKERS > 0:
+            self.repository.preload(Settings.SPRITESHEET_DECODE_WORKERS)
 
         self.library = {}
+        self.library_by_id = {}
+        self.atlas_index = {}
+        self.atlas_names_by_id = {}
+        self.cache = SpriteCache()
+        self.lock = threading.RLock()
         self.populate_library()
 
         # Add event handlers
@@ -41,39 +61,93 @@ class SpriteService(ServiceBase):
 
     def get_sprite_from(self, type: SpriteType, key: str | int) -> Sprite:
         """Get a sprite from the library."""
+        sprite = self.get_library_sprite(type, key)
+        if sprite is not None:
+            return sprite.copy()
+
+    def get_library_sprite(self, type: SpriteType, key: str | int) -> Sprite:
+        """Get the library sprite itself, creating it on first access when the library is lazy.
+        Creation is locked, so maps can be loaded on a background thread."""
         if isinstance(key, int):
-            library = self.library[type].values()
-            for sprite in library:
-                if sprite.id == key:
-                    return sprite.copy()
-        else:
-            return self.library[type][key].copy()
+            sprite = self.library_by_id[type].get(key)
+            if sprite is None and key in self.atlas_names_by_id[type]:
+                with self.lock:
+                    sprite = self.library_by_id[type].get(key) or self.create_library_sprite(
+                        type, self.atlas_names_by_id[type][key]
+                    )
+            return sprite
+
+        sprite = self.library[type].get(key)
+        if sprite is None:
+            with self.lock:
+                sprite = self.library[type].get(key) or self.create_library_sprite(
+                    type, key
+                )
+        return sprite
+
+    def warm_up(self, sprites: list[tuple[SpriteType, str | int]]):
+        """Create the given library sprites ahead of their first use."""
+        for type, key in sprites:
+            self.get_library_sprite(type, key)
+
+    def load_spritesheets(self, types: list[SpriteType]):
+        """Load the sheets and mask layers of the given sprite types, converting them to the display format.
+        Converting needs the display, so this is called on the main thread before sprites are created on another thread."""
+        for type in types:
+            for spritesheet in self.repository.get_spritesheets(type):
+                spritesheet.get_sprite_sheet()
+                spritesheet.get_mask_layers()
 
     def populate_library(self):
-        """Populate the sprite library."""
+        """Populate the sprite library, in lazy mode only the atlases are read and sprites are created on first access."""
         for type, spritesheet_list in self.repository.entries.items():
             for spritesheet in spritesheet_list:
                 self.populate_library_type(type, spritesheet)
 
+        if not Settings.LAZY_SPRITE_LIBRARY:
+            for type, names in self.atlas_index.items():
+                for name in names:
+                    self.create_library_sprite(type, name)
+
     def populate_library_type(self, type: SpriteType, spritesheet: Spritesheet):
-        """Populate the sprite library for a specific type."""
-        next_id = 0
+        """Index the sprites in a spritesheet's atlas, ids continue where earlier sheets of the type ended."""
+        if type not in self.atlas_index:
+            self.library[type] = {}
+            self.library_by_id[type] = {}
+            self.atlas_index[type] = {}
+            self.atlas_names_by_id[type] = {}
 
         for name in spritesheet.get_sprite_atlas().keys():
-            if type not in self.library:
-                self.library[type] = {}
-            else:
-                next_id = list(self.library[type].values())[-1].id + 1
-
-            self.library[type][name] = Sprite(
-                spritesheet.get_sprite(name),
-                spritesheet.get_mask_from_layer(name, 0),
-                name,
-                next_id,
-                type,
-                scale=Settings.SCALE[type],
+            next_id = len(self.atlas_names_by_id[type])
+            self.atlas_index[type][name] = (spritesheet, next_id)
+            self.atlas_names_by_id[type][next_id] = name
+
+    def create_library_sprite(self, type: SpriteType, name: str) -> Sprite:
+        """Create a library sprite from its spritesheet, including the rotation atlas for vehicles."""
+        spritesheet, id = self.atlas_index[type][name]
+
+        sprite = Sprite(
+            spritesheet.get_sprite(name),
+            spritesheet.get_mask_from_layer(name, 0),
+            name,
+            id,
+            type,
+            scale=Settings.SCALE[type],
+            cache=self.cache,
+        )
+
+        if type == SpriteType.VEHICLE:
+            sprite.rotation_atlas = RotationAtlas(
+                sprite.surface,
+                sprite.mask_surface,
+                sprite.get_scaled_size(),
+                Settings.ROTATION_ATLAS_STEPS,
             )
 
+        self.library[type][name] = sprite
+        self.library_by_id[type][id] = sprite
+        return sprite
+
     def handle_log_message(self, message: str, log_level: LogLevel):
         """Handle a log message."""
         self.services.logger.log(message, log_level)
@@ -0,0 +1,46 @@
+import math
+import pygame
+from core.position import Position
+
+
+class SpatialGrid:
+    """Uniform grid used as a collision broadphase, items are bucketed by every cell their rect overlaps."""
+
+    def __init__(self, cell_size: int, origin: Position = Position((0, 0))):
+        self.cell_size = cell_size
+        self.origin = origin
+        self.cells = {}
+        self.size = 0
+
+    def insert(self, item, rect: pygame.Rect):
+        """Insert an item in every cell its rect overlaps."""
+        entry = (self.size, item)
+        self.size += 1
+
+        for cell in self.get_cells(rect):
+            if cell not in self.cells:
+                self.cells[cell] = []
+            self.cells[cell].append(entry)
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Return the items in the cells overlapped by the rect, in insertion order and without duplicates."""
+        found = {}
+        for cell in self.get_cells(rect):
+            for index, item in self.cells.get(cell, ()):
+                found[index] = item
+
+        return [found[index] for index in sorted(found)]
+
+    def get_cells(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """Return the cell coordinates overlapped by the rect."""
+        origin_x, origin_y = self.origin.get_pos()
+        first_column = math.floor((rect.left - origin_x) / self.cell_size)
+        last_column = math.floor((rect.right - 1 - origin_x) / self.cell_size)
+        first_row = math.floor((rect.top - origin_y) / self.cell_size)
+        last_row = math.floor((rect.bottom - 1 - origin_y) / self.cell_size)
+
+        return [
+            (column, row)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)
+        ]
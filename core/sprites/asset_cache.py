@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+import hashlib
+import json
+import mmap
+import os
+import pygame
+from pathlib import Path
+from core.enums.log_level import LogLevel
+
+from core.event_handler import EventHandler
+
+
+class AssetCache:
+    """Compiled spritesheets, the parsed atlas and raw pixel buffers of the sheet and its mask layers.
+    Entries are invalidated by the hash of their source files, the version is bumped when the format changes."""
+
+    VERSION = 1
+    PIXEL_FORMAT = "RGB"
+
+    def __init__(self, root_path):
+        self.root_path = Path(root_path) / f"v{self.VERSION}"
+        self.manifests = {}
+
+        # Create events
+        self.events = SimpleNamespace()
+        self.events.on_log_message = EventHandler()
+
+    def get_source_files(self, spritesheet) -> list[Path]:
+        """Returns the source files of a spritesheet, the atlas, the sheet and its mask layers."""
+        return [
+            spritesheet.file_path.with_suffix(".xml"),
+            spritesheet.file_path,
+            *[
+                spritesheet.get_mask_layer_path(layer)
+                for layer in range(spritesheet.mask_layer_amount)
+            ],
+        ]
+
+    def get_source_hash(self, spritesheet) -> str:
+        """Returns the hash of all source files of a spritesheet."""
+        source_hash = hashlib.sha1()
+        for file_path in self.get_source_files(spritesheet):
+            source_hash.update(file_path.read_bytes())
+        return source_hash.hexdigest()
+
+    def get_manifest_path(self, spritesheet) -> Path:
+        """Returns the path of the manifest of a compiled spritesheet."""
+        return self.root_path / f"{spritesheet.file_path.stem}.json"
+
+    def get_manifest(self, spritesheet) -> dict | None:
+        """Returns the manifest of a spritesheet, None when it was never compiled or its sources changed."""
+        key = spritesheet.file_path
+        if key not in self.manifests:
+            self.manifests[key] = self.load_manifest(spritesheet)
+        return self.manifests[key]
+
+    def load_manifest(self, spritesheet) -> dict | None:
+        """Loads the manifest of a spritesheet and checks it against the hash of the sources."""
+        manifest_path = self.get_manifest_path(spritesheet)
+        if not manifest_path.exists():
+            return None
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("source_hash") != self.get_source_hash(spritesheet):
+            self.events.on_log_message.notify(
+                f"Stale [AssetCache]: {spritesheet.file_path.name}", LogLevel.DEBUG
+            )
+            return None
+        return manifest
+
+    def is_valid(self, spritesheet) -> bool:
+        """Returns whether the compiled spritesheet is up to date with its sources."""
+        return self.get_manifest(spritesheet) is not None
+
+    def load_atlas(self, spritesheet) -> dict | None:
+        """Returns the compiled atlas of a spritesheet, None when it isn't compiled."""
+        manifest = self.get_manifest(spritesheet)
+        return manifest["atlas"] if manifest is not None else None
+
+    def load_image(self, spritesheet, file_path: Path) -> pygame.Surface | None:
+        """Returns an image of a spritesheet in the display format, None when it isn't compiled.
+        The pixel buffer is memory-mapped and converted in place, the conversion is its only copy.
+        Converting needs the display, so it is called on the main thread."""
+        manifest = self.get_manifest(spritesheet)
+        if manifest is None or Path(file_path).name not in manifest["images"]:
+            return None
+
+        image = manifest["images"][Path(file_path).name]
+        self.events.on_log_message.notify(
+            f"Loading [AssetCache]:  {image['file']}", LogLevel.DEBUG
+        )
+        with open(self.root_path / image["file"], "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                view = pygame.image.frombuffer(
+                    buffer, tuple(image["size"]), self.PIXEL_FORMAT
+                )
+                surface = view.convert()
+                del view
+        return surface
+
+    def compile(self, spritesheet, decoded_images: dict[Path, pygame.Surface] = None):
+        """Compiles a spritesheet from its sources, the manifest is written last so a partial compile is never used.
+        Images that were already decoded are passed as decoded images, the others are decoded here."""
+        self.events.on_log_message.notify(
+            f"Compiling [AssetCache]: {spritesheet.file_path.name}", LogLevel.DEBUG
+        )
+        self.root_path.mkdir(parents=True, exist_ok=True)
+
+        images = {}
+        for file_path in self.get_source_files(spritesheet)[1:]:
+            if decoded_images is not None and file_path in decoded_images:
+                surface = decoded_images[file_path]
+            else:
+                surface = pygame.image.load(str(file_path))
+            file_name = f"{file_path.stem}.{self.PIXEL_FORMAT.lower()}"
+            self.write_file(
+                self.root_path / file_name,
+                pygame.image.tobytes(surface, self.PIXEL_FORMAT),
+            )
+            images[file_path.name] = {"file": file_name, "size": surface.get_size()}
+
+        manifest = {
+            "version": self.VERSION,
+            "source_hash": self.get_source_hash(spritesheet),
+            "atlas": spritesheet.load_atlas(),
+            "images": images,
+        }
+        self.write_file(
+            self.get_manifest_path(spritesheet), json.dumps(manifest).encode()
+        )
+        self.manifests[spritesheet.file_path] = manifest
+
+    @staticmethod
+    def write_file(file_path: Path, data: bytes):
+        """Writes a file through a temporary file, so readers never see a partially written file."""
+        temporary_path = file_path.with_name(f"{file_path.name}.tmp")
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, file_path)
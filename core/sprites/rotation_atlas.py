@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+import pygame
+from core.position import Position
+
+
+class RotationAtlas:
+    """Pre-rendered rotations of a sprite and its mask, looked up by the nearest quantized angle."""
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        mask_surface: pygame.Surface | None,
+        size: tuple[int, int],
+        steps: int,
+    ):
+        self.steps = steps
+        self.step_size = 360 / steps
+
+        scaled_surface = pygame.transform.scale(surface, size)
+        scaled_mask_surface = (
+            pygame.transform.scale(mask_surface, size)
+            if mask_surface is not None
+            else None
+        )
+
+        self.entries = [
+            self.render(scaled_surface, scaled_mask_surface, index * self.step_size)
+            for index in range(steps)
+        ]
+
+    def get_index(self, rotation: float) -> int:
+        """Returns the index of the entry nearest to the rotation."""
+        return round((rotation % 360) / self.step_size) % self.steps
+
+    def get(self, rotation: float) -> SimpleNamespace:
+        """Returns the entry nearest to the rotation."""
+        return self.entries[self.get_index(rotation)]
+
+    def render(
+        self,
+        surface: pygame.Surface,
+        mask_surface: pygame.Surface | None,
+        rotation: float,
+    ) -> SimpleNamespace:
+        """Render the surface and mask at a rotation, offsets are relative to the center like Sprite does."""
+        rotated_surface = pygame.transform.rotate(surface, -rotation).convert_alpha()
+        offset = Position(
+            (-(rotated_surface.get_width() / 2), -(rotated_surface.get_height() / 2))
+        )
+
+        rotated_mask_surface = None
+        mask = None
+        if mask_surface is not None:
+            rotated_mask_surface = pygame.transform.rotate(mask_surface, -rotation)
+            mask = pygame.mask.from_surface(rotated_mask_surface)
+
+        return SimpleNamespace(
+            surface=rotated_surface,
+            offset=offset,
+            mask_surface=rotated_mask_surface,
+            mask=mask,
+        )
@@ -2,7 +2,9 @@ import copy
 import pygame
 from core.position import Position
 from core.enums.sprite_type import SpriteType
+from core.sprites.sprite_cache import SpriteCache
 from settings import Settings
+from utilities.helper import Helper
 
 
 class Sprite:
@@ -17,41 +19,77 @@ class Sprite:
         rotation: float = None,
         scale: float = 1.0,
         opacity: int = 255,
+        cache: SpriteCache = None,
     ):
         self.surface = surface
-        self.__scaled_surface = None
-        self.__transformed_surface = None
-        self.__transformed_surface_offset = None
-        self.__last_surface_rotation = None
-        self.__last_surface_opacity = None
         self.mask_surface = mask
-        self.__scaled_mask_surface = None
-        self.__transformed_mask_surface = None
-        self.__transformed_mask_surface_offset = None
-        self.__last_mask_surface_rotation = None
-        self.__mask = None
         self.name = name
         self.id = id
         self.sprite_type = sprite_type
+        self.rotation_atlas = None
+
+        # Derived surfaces and masks live in the cache, shared with every copy of this sprite
+        self.cache = cache if cache is not None else SpriteCache()
+        self.__surface_key = None
+        self.__surface_entry = None
+        self.__mask_key = None
+        self.__mask_entry = None
 
         self.position = position
         self.rotation = rotation
         self.scale = scale
         self.opacity = opacity
 
-    def draw(self, screen: pygame.Surface, opacity: int = 255):
+    def __del__(self):
+        self.release_cache()
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        opacity: int = 255,
+        screen_offset: tuple[float, float] = (0, 0),
+    ):
+        """Draw the sprite, the screen offset is added to the position, used when drawing onto off-screen surfaces."""
         self.opacity = opacity
 
         sprite, offset = self.get_sprite()
-        screen.blit(sprite, self.position.get_absolute_pos() + offset)
-        
+        x, y = self.position.get_absolute_pos() + offset
+        screen.blit(sprite, (x + screen_offset[0], y + screen_offset[1]))
+
         if Settings.DRAW_MASKS and self.mask_surface is not None:
             _, offset, sprite_mask = self.get_mask()
-            screen.blit(sprite_mask, self.position.get_absolute_pos() + offset)
+            x, y = self.position.get_absolute_pos() + offset
+            screen.blit(sprite_mask, (x + screen_offset[0], y + screen_offset[1]))
 
 
+    def get_rect(self, screen_offset: tuple[float, float] = (0, 0)) -> pygame.Rect:
+        """Returns the screen rect the sprite covers when drawn, padded for float positions"""
+        sprite, offset = self.get_sprite()
+        x, y = self.position.get_absolute_pos() + offset
+        return pygame.Rect(
+            (x + screen_offset[0], y + screen_offset[1]), sprite.get_size()
+        ).inflate(2, 2)
+
     def copy(self):
-        return copy.copy(self)
+        """Returns a copy sharing the cache, the copy holds no cache references of its own yet"""
+        sprite = copy.copy(self)
+        sprite.__surface_key = None
+        sprite.__surface_entry = None
+        sprite.__mask_key = None
+        sprite.__mask_entry = None
+        return sprite
+
+    def release_cache(self):
+        """Release the cache entries held by this sprite"""
+        if self.__surface_key is not None:
+            self.cache.release(self.__surface_key)
+            self.__surface_key = None
+            self.__surface_entry = None
+
+        if self.__mask_key is not None:
+            self.cache.release(self.__mask_key)
+            self.__mask_key = None
+            self.__mask_entry = None
 
     def get_scaled_size(self) -> tuple[int, int]:
         """Returns the scaled height of the object"""
@@ -62,54 +100,81 @@ class Sprite:
 
     def get_mask(self) -> tuple[pygame.mask.Mask | None, Position, pygame.Surface]:
         """Returns a scaled, rotated surface, and mask, also return the center offset as a Position"""
-        if self.__scaled_mask_surface is None:
-            self.__scaled_mask_surface = pygame.transform.scale(
-                self.mask_surface, self.get_scaled_size()
-            )
+        if self.rotation_atlas is not None and self.rotation is not None:
+            entry = self.rotation_atlas.get(self.rotation)
+            return (entry.mask, entry.offset, entry.mask_surface)
 
-        if (
-            self.rotation != self.__last_mask_surface_rotation
-            or self.__mask is None
-            or self.__transformed_mask_surface is None
-        ):
-            (
-                self.__transformed_mask_surface,
-                self.__transformed_mask_surface_offset,
-            ) = self.__get_transformed_surface(self.__scaled_mask_surface, False)
-            self.__mask = pygame.mask.from_surface(self.__scaled_mask_surface)
-            self.__last_mask_surface_rotation = self.rotation
+        if self.mask_surface is None:
+            return (None, Position((0, 0)), None)
 
-        return (
-            self.__mask,
-            self.__transformed_mask_surface_offset,
-            self.__transformed_mask_surface,
-        )
+        key = ("mask", self.id, self.sprite_type, self.scale, self.rotation)
+        if key != self.__mask_key:
+            entry = self.cache.acquire(key, self.__create_mask)
+            if self.__mask_key is not None:
+                self.cache.release(self.__mask_key)
+            self.__mask_key = key
+            self.__mask_entry = entry
+
+        return self.__mask_entry
 
     def get_sprite(self) -> tuple[pygame.Surface, Position]:
         """Returns a scaled, rotated surface, and mask with opacity, also return the center offset as a Position"""
-        if self.__scaled_surface is None:
-            self.__scaled_surface = pygame.transform.scale(
-                self.surface, self.get_scaled_size()
+        opacity_bucket = Helper.get_opacity_bucket(self.opacity)
+
+        if self.rotation_atlas is not None and self.rotation is not None:
+            index = self.rotation_atlas.get_index(self.rotation)
+            if opacity_bucket == 255:
+                entry = self.rotation_atlas.entries[index]
+                return (entry.surface, entry.offset)
+
+            key = ("atlas", self.id, self.sprite_type, index, opacity_bucket)
+            create = lambda: self.__create_atlas_surface(index, opacity_bucket)
+        else:
+            key = (
+                "surface",
+                self.id,
+                self.sprite_type,
+                self.scale,
+                self.rotation,
+                opacity_bucket,
             )
+            create = lambda: self.__create_surface(opacity_bucket)
 
-        if (
-            self.rotation != self.__last_surface_rotation
-            or self.opacity != self.__last_surface_opacity
-            or self.__transformed_surface is None
-        ):
-            (
-                self.__transformed_surface,
-                self.__transformed_surface_offset,
-            ) = self.__get_transformed_surface(self.__scaled_surface, True)
-            self.__last_surface_rotation = self.rotation
-            self.__last_surface_opacity = self.opacity
-
-        return (self.__transformed_surface, self.__transformed_surface_offset)
-
-    def __get_transformed_surface(
-        self, surface, has_opacity
-    ) -> tuple[pygame.Surface, Position]:
+        if key != self.__surface_key:
+            entry = self.cache.acquire(key, create)
+            if self.__surface_key is not None:
+                self.cache.release(self.__surface_key)
+            self.__surface_key = key
+            self.__surface_entry = entry
+
+        return self.__surface_entry
+
+    def __create_surface(self, opacity: int) -> tuple[pygame.Surface, Position]:
         """Returns a scaled, rotated surface with opacity, also return the center offset as a Position"""
+        surface = pygame.transform.scale(self.surface, self.get_scaled_size())
+        surface, center_offset = self.__get_transformed_surface(surface)
+
+        surface = surface.convert_alpha()
+        surface.set_alpha(opacity)
+        return (surface, center_offset)
+
+    def __create_mask(self) -> tuple[pygame.mask.Mask, Position, pygame.Surface]:
+        """Returns the mask of the scaled, rotated mask surface, its center offset as a Position, and the surface"""
+        surface = pygame.transform.scale(self.mask_surface, self.get_scaled_size())
+        surface, center_offset = self.__get_transformed_surface(surface)
+        return (pygame.mask.from_surface(surface), center_offset, surface)
+
+    def __create_atlas_surface(
+        self, index: int, opacity: int
+    ) -> tuple[pygame.Surface, Position]:
+        """Returns a copy of a pre-rendered rotation with opacity, the atlas itself stays opaque"""
+        entry = self.rotation_atlas.entries[index]
+        surface = entry.surface.copy()
+        surface.set_alpha(opacity)
+        return (surface, entry.offset)
+
+    def __get_transformed_surface(self, surface) -> tuple[pygame.Surface, Position]:
+        """Returns a rotated surface, also return the center offset as a Position"""
         center_offset = Position((0, 0))
         if self.rotation is not None:
             # Create a new surface with the image, rotated
@@ -122,8 +187,4 @@ class Sprite:
                 (-(surface.get_width() / 2), -(surface.get_height() / 2))
             )
 
-        if has_opacity:
-            surface = surface.convert_alpha()
-            surface.set_alpha(self.opacity)
-
         return (surface, center_offset)
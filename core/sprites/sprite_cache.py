@@ -0,0 +1,32 @@
+import threading
+
+
+class SpriteCache:
+    """Reference counted cache for the derived surfaces and masks of sprites, shared by all copies of a sprite.
+    An entry is removed as soon as no sprite uses it anymore, the cache is safe to use from loader threads."""
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.RLock()
+
+    def acquire(self, key, create):
+        """Return the value for the key and add a reference to it, the create function is only called when it is not cached."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = [create(), 0]
+                self.entries[key] = entry
+
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, key):
+        """Remove a reference to the key, the entry is removed when it has no references left."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self.entries[key]
@@ -5,14 +5,16 @@ from pathlib import Path
 from core.enums.log_level import LogLevel
 
 from core.event_handler import EventHandler
+from settings import Settings
 
 
 class Spritesheet:
     """Class for loading and handling spritesheets."""
 
-    def __init__(self, file_path, mask_layer_amount: int = 0):
+    def __init__(self, file_path, mask_layer_amount: int = 0, asset_cache=None):
         self.file_path = Path(file_path)
         self.mask_layer_amount = mask_layer_amount
+        self.asset_cache = asset_cache
 
         # private variables
         self._sprite_sheet = None
@@ -26,7 +28,10 @@ class Spritesheet:
     def get_sprite_atlas(self):
         """Returns a dictionary with the sprite atlas, loads the atlas if it hasn't been loaded."""
         if self._sprite_atlas is None:
-            self._sprite_atlas = self.load_atlas()
+            if self.asset_cache is not None:
+                self._sprite_atlas = self.asset_cache.load_atlas(self)
+            if self._sprite_atlas is None:
+                self._sprite_atlas = self.load_atlas()
         return self._sprite_atlas
 
     def get_sprite_sheet(self):
@@ -39,19 +44,45 @@ class Spritesheet:
         """Returns a dictionary with the mask layers, loads the images if they haven't been loaded."""
         if self._mask_layers is None:
             self._mask_layers = {
-                layer: self.load_image(
-                    self.file_path.with_stem(f"{self.file_path.stem}_mask{layer}")
-                )
+                layer: self.load_image(self.get_mask_layer_path(layer))
                 for layer in range(self.mask_layer_amount)
             }
         return self._mask_layers
 
+    def get_mask_layer_path(self, layer: int) -> Path:
+        """Returns the file path of a mask layer image."""
+        return self.file_path.with_stem(f"{self.file_path.stem}_mask{layer}")
+
+    def get_image_paths(self) -> list[Path]:
+        """Returns the file paths of the sheet and its mask layers."""
+        return [self.file_path] + [
+            self.get_mask_layer_path(layer) for layer in range(self.mask_layer_amount)
+        ]
+
+    def set_images(self, images: dict[Path, pygame.Surface]):
+        """Set the sheet and mask layers from decoded images, they are converted to the display format here."""
+        self._sprite_sheet = images[self.file_path].convert()
+        self._mask_layers = {
+            layer: images[self.get_mask_layer_path(layer)].convert()
+            for layer in range(self.mask_layer_amount)
+        }
+
     def load_image(self, file_path: Path):
-        """Loads an image from a file path."""
+        """Loads an image in the display format, from the asset cache when it is compiled."""
         self.events.on_log_message.notify(
             f"Loading [Spritesheet]:  {file_path}", LogLevel.DEBUG
         )
-        return pygame.image.load(str(file_path)).convert()
+        if self.asset_cache is not None:
+            surface = self.asset_cache.load_image(self, file_path)
+            if surface is not None:
+                return surface
+
+        return self.decode_image(file_path).convert()
+
+    def decode_image(self, file_path: Path) -> pygame.Surface:
+        """Decodes an image from the file path.
+        Decoding doesn't touch the display, so it is safe to call from other threads."""
+        return pygame.image.load(str(file_path))
 
     def load_atlas(self):
         """Loads the sprite atlas from a file path, based on the file name for this sprite sheet."""
@@ -68,32 +99,51 @@ class Spritesheet:
         }
 
     def create_sprite_from_sheet(
-        self, x: int, y: int, w: int, h: int, sheet: pygame.Surface
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        sheet: pygame.Surface,
+        private: bool = False,
     ):
-        """Create a sprite from a sheet, coordinates usually come from the sprite sheet its xml."""
-        sprite = pygame.Surface((w, h))
+        """Create a sprite from a sheet, coordinates usually come from the sprite sheet its xml.
+        By default the sprite is a subsurface view sharing the sheet's pixels. Colorkey and alpha are kept per view,
+        so a private copy is only needed when the pixels get drawn on, or the region is not fully inside the sheet."""
+        rect = pygame.Rect(x, y, w, h)
+        if (
+            Settings.SPRITESHEET_SUBSURFACES
+            and not private
+            and sheet.get_rect().contains(rect)
+        ):
+            sprite = sheet.subsurface(rect)
+        else:
+            sprite = pygame.Surface((w, h))
+            sprite.blit(sheet, (0, 0), rect)
+
         sprite.set_colorkey((0, 0, 0))
-        sprite.blit(sheet, (0, 0), (x, y, w, h))
         return sprite
 
-    def get_sprite(self, name: str):
-        """Get a sprite from the sprite sheet."""
+    def get_sprite(self, name: str, private: bool = False):
+        """Get a sprite from the sprite sheet, private sprites are a copy that can be drawn on."""
         x, y, w, h = self.get_sprite_atlas()[name].values()
-        return self.create_sprite_from_sheet(x, y, w, h, self.get_sprite_sheet())
+        return self.create_sprite_from_sheet(
+            x, y, w, h, self.get_sprite_sheet(), private
+        )
 
-    def get_mask_from_layer(self, name: str, mask_layer: int):
-        """Get a mask from a layer of the sprite sheet."""
+    def get_mask_from_layer(self, name: str, mask_layer: int, private: bool = False):
+        """Get a mask from a layer of the sprite sheet, private masks are a copy that can be drawn on."""
         if self.mask_layer_amount == 0 or mask_layer > self.mask_layer_amount:
             return None
 
         x, y, w, h = self.get_sprite_atlas()[name].values()
         return self.create_sprite_from_sheet(
-            x, y, w, h, self.get_mask_layers()[mask_layer]
+            x, y, w, h, self.get_mask_layers()[mask_layer], private
         )
 
-    def get_mask_from_all_layers(self, name: str):
+    def get_mask_from_all_layers(self, name: str, private: bool = False):
         """Get a mask from all layers of the sprite sheet."""
         return {
-            layer: self.get_mask_from_layer(name, layer)
+            layer: self.get_mask_from_layer(name, layer, private)
             for layer in self.get_mask_layers()
         }
@@ -1,4 +1,6 @@
 from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+import time
 import pygame
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -6,14 +8,21 @@ from core.enums.log_level import LogLevel
 from core.enums.sprite_type import SpriteType
 
 from core.event_handler import EventHandler
+from core.sprites.asset_cache import AssetCache
 from core.sprites.spritesheet import Spritesheet
 
 
 class SpritesheetRepository:
     """Class for loading and handling spritesheets."""
 
-    def __init__(self, root_path, spritesheets: list[tuple[SpriteType, str, int]]):
+    def __init__(
+        self,
+        root_path,
+        spritesheets: list[tuple[SpriteType, str, int]],
+        asset_cache: AssetCache = None,
+    ):
         self.root_path = Path(root_path)
+        self.asset_cache = asset_cache
         self.entries = {}
 
         self.create_entries(spritesheets)
@@ -34,9 +43,105 @@ class SpritesheetRepository:
                 self.entries[sprite_type] = []
 
             self.entries[sprite_type].append(
-                Spritesheet(self.root_path / file_name, mask_layer_amount)
+                Spritesheet(
+                    self.root_path / file_name, mask_layer_amount, self.asset_cache
+                )
             )
-    
+
+    def compile_assets(self, max_workers: int = 0):
+        """Compile the spritesheets that are missing from the asset cache, or whose sources changed.
+        The sources are decoded on a thread pool with max workers threads, 0 decodes them on the main thread."""
+        if self.asset_cache is None:
+            return
+
+        spritesheets = [
+            spritesheet
+            for spritesheet in self.get_all_spritesheets()
+            if not self.asset_cache.is_valid(spritesheet)
+        ]
+        if max_workers == 0:
+            for spritesheet in spritesheets:
+                self.asset_cache.compile(spritesheet)
+            return
+
+        for spritesheet, images, decode_time in self.decode_all(spritesheets, max_workers):
+            start = time.perf_counter()
+            self.asset_cache.compile(spritesheet, images)
+            compile_time = time.perf_counter() - start
+
+            self.events.on_log_message.notify(
+                f"Compiled [Spritesheet]: {spritesheet.file_path.name}, "
+                f"decoded {len(images)} images in {decode_time * 1000:.1f}ms, "
+                f"compiled in {compile_time * 1000:.1f}ms",
+                LogLevel.DEBUG,
+            )
+
+    def preload(self, max_workers: int):
+        """Decode all sheets and mask layers on a thread pool, the display format conversion happens on the main thread.
+        Compiled sheets have nothing to decode, they are converted from the asset cache on the main thread."""
+        spritesheets = []
+        for spritesheet in self.get_all_spritesheets():
+            if self.asset_cache is None or not self.asset_cache.is_valid(spritesheet):
+                spritesheets.append(spritesheet)
+                continue
+
+            start = time.perf_counter()
+            spritesheet.get_sprite_sheet()
+            spritesheet.get_mask_layers()
+            convert_time = time.perf_counter() - start
+
+            self.events.on_log_message.notify(
+                f"Loaded [Spritesheet]: {spritesheet.file_path.name}, "
+                f"converted {len(spritesheet.get_image_paths())} images from the asset cache "
+                f"in {convert_time * 1000:.1f}ms",
+                LogLevel.DEBUG,
+            )
+
+        for spritesheet, images, decode_time in self.decode_all(spritesheets, max_workers):
+            start = time.perf_counter()
+            spritesheet.set_images(images)
+            convert_time = time.perf_counter() - start
+
+            self.events.on_log_message.notify(
+                f"Loaded [Spritesheet]: {spritesheet.file_path.name}, "
+                f"decoded {len(images)} images in {decode_time * 1000:.1f}ms, "
+                f"converted in {convert_time * 1000:.1f}ms",
+                LogLevel.DEBUG,
+            )
+
+    def decode_all(self, spritesheets: list[Spritesheet], max_workers: int):
+        """Decode the sheets and mask layers of spritesheets on a thread pool.
+        Yields every spritesheet in order with its decoded images and the time they took to decode."""
+        if not spritesheets:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                spritesheet: {
+                    file_path: executor.submit(
+                        self.decode_image, spritesheet, file_path
+                    )
+                    for file_path in spritesheet.get_image_paths()
+                }
+                for spritesheet in spritesheets
+            }
+
+            for spritesheet, image_futures in futures.items():
+                images = {}
+                decode_time = 0
+                for file_path, future in image_futures.items():
+                    images[file_path], image_decode_time = future.result()
+                    decode_time += image_decode_time
+
+                yield (spritesheet, images, decode_time)
+
+    @staticmethod
+    def decode_image(spritesheet: Spritesheet, file_path) -> tuple[pygame.Surface, float]:
+        """Decode an image of a spritesheet, also returns the time it took to decode."""
+        start = time.perf_counter()
+        surface = spritesheet.decode_image(file_path)
+        return (surface, time.perf_counter() - start)
+
     def get_spritesheets(self, sprite_type: SpriteType):
         """Returns a list of spritesheets for the given sprite type."""
         return self.entries[sprite_type]
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+import pygame
+
+
+class TextRenderCache:
+    """Least recently used cache for rendered text surfaces, bounded by the pixel memory the surfaces use."""
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.used = 0
+        self.entries = OrderedDict()
+
+    def get(self, key, render) -> pygame.Surface:
+        """Return the surface for the key, the render function is only called when it is not cached."""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+
+        surface = render()
+        self.entries[key] = surface
+        self.used += self.get_surface_size(surface)
+
+        # Evict the least recently used surfaces, but always keep the one just rendered
+        while self.used > self.budget and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.used -= self.get_surface_size(evicted)
+
+        return surface
+
+    def clear(self):
+        """Remove all cached surfaces."""
+        self.entries.clear()
+        self.used = 0
+
+    @staticmethod
+    def get_surface_size(surface: pygame.Surface) -> int:
+        """Return the amount of bytes used by the pixels of a surface."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
@@ -0,0 +1,30 @@
+import mmap
+from pathlib import Path
+from core.trace_file import TraceFile
+
+
+class Trace:
+    """A trace file mapped into memory, samples are read by tick without loading the file."""
+
+    def __init__(self, file_path: Path):
+        with open(file_path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.header = TraceFile.read_header(self.data, Path(file_path).name)
+        self.laps = TraceFile.read_laps(self.data, self.header)
+
+    def __len__(self):
+        return self.header.tick_count
+
+    def get_sample(self, tick: int) -> tuple[float, float, float]:
+        """Get the position and rotation at a tick, ticks past the end give the last sample."""
+        return TraceFile.read_sample(
+            self.data, self.header, max(0, min(tick, self.header.tick_count - 1))
+        )
+
+    def get_best_lap(self) -> tuple[int, int, float] | None:
+        """Get the start tick, end tick and time of the fastest lap, None when no lap was completed."""
+        return min(self.laps, key=lambda lap: lap[2], default=None)
+
+    def close(self):
+        """Unmap the file."""
+        self.data.close()
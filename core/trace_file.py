@@ -0,0 +1,74 @@
+import struct
+from types import SimpleNamespace
+
+
+class TraceFile:
+    """Binary trace file, the position and rotation of a car on every tick followed by a table of its laps.
+    The tick and lap counts in the header are written when the recording is closed, the samples are streamed before."""
+
+    MAGIC = b"RTRC"
+    VERSION = 1
+    EXTENSION = ".rtrc"
+    HEADER = struct.Struct("<4sHdIHBH")  # magic, version, timedelta, tick count, lap count, car option, name length
+    SAMPLE = struct.Struct("<fff")  # x, y, rotation
+    LAP = struct.Struct("<IId")  # start tick, end tick, lap time
+
+    @classmethod
+    def read_header(cls, data, name: str = "trace") -> SimpleNamespace:
+        """Read the header from the start of the file data, the offsets of the samples and laps are added to it."""
+        magic, version, timedelta, tick_count, lap_count, car_option, name_length = (
+            cls.HEADER.unpack_from(data)
+        )
+        if magic != cls.MAGIC:
+            raise ValueError(f"{name} is not a trace file")
+        if version != cls.VERSION:
+            raise ValueError(f"{name} has unsupported trace version {version}")
+
+        samples_offset = cls.HEADER.size + name_length
+        return SimpleNamespace(
+            name=bytes(data[cls.HEADER.size : samples_offset]).decode("utf-8"),
+            timedelta=timedelta,
+            tick_count=tick_count,
+            lap_count=lap_count,
+            car_option=car_option,
+            samples_offset=samples_offset,
+            laps_offset=samples_offset + tick_count * cls.SAMPLE.size,
+        )
+
+    @classmethod
+    def write_header(
+        cls, file, timedelta: float, tick_count: int, lap_count: int, car_option: int, name: str
+    ):
+        """Write the header at the start of an open file, the name follows it."""
+        encoded_name = name.encode("utf-8")
+        file.seek(0)
+        file.write(
+            cls.HEADER.pack(
+                cls.MAGIC, cls.VERSION, timedelta, tick_count, lap_count, car_option, len(encoded_name)
+            )
+        )
+        file.write(encoded_name)
+
+    @classmethod
+    def write_sample(cls, file, x: float, y: float, rotation: float):
+        """Write the position and rotation of a tick."""
+        file.write(cls.SAMPLE.pack(x, y, rotation))
+
+    @classmethod
+    def write_laps(cls, file, laps: list[tuple[int, int, float]]):
+        """Write the lap table after the samples, every lap is its start tick, end tick and lap time."""
+        for start_tick, end_tick, lap_time in laps:
+            file.write(cls.LAP.pack(start_tick, end_tick, lap_time))
+
+    @classmethod
+    def read_sample(cls, data, header: SimpleNamespace, tick: int) -> tuple[float, float, float]:
+        """Read the position and rotation of a tick, straight from the file data."""
+        return cls.SAMPLE.unpack_from(data, header.samples_offset + tick * cls.SAMPLE.size)
+
+    @classmethod
+    def read_laps(cls, data, header: SimpleNamespace) -> list[tuple[int, int, float]]:
+        """Read the lap table."""
+        return [
+            cls.LAP.unpack_from(data, header.laps_offset + index * cls.LAP.size)
+            for index in range(header.lap_count)
+        ]
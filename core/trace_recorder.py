@@ -0,0 +1,80 @@
+from pathlib import Path
+from types import SimpleNamespace
+from core.car import Car
+from core.event_handler import EventHandler
+from core.trace_file import TraceFile
+from settings import Settings
+
+
+class TraceRecorder:
+    """Records the position and rotation of a car on every tick of a race to a trace file, with the ticks of its laps."""
+
+    def __init__(self, file_path: Path, race, car: Car, car_option: int):
+        self.file_path = file_path
+        self.race = race
+        self.car = car
+        self.car_option = car_option
+        self.file = None
+        self.tick = 0
+        self.lap_started = None
+        self.laps = []
+        self.finished = False
+
+        # Create events
+        self.events = SimpleNamespace()
+        self.events.on_trace_recorded = EventHandler()
+
+    def start(self):
+        """Write a header without ticks and record every tick from now on."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.file_path, "wb")
+        TraceFile.write_header(self.file, 1.0 / Settings.TICK_RATE, 0, 0, self.car_option, self.car.name)
+
+        self.race.events.on_stage_completed += self.handle_stage_completed
+        self.race.race_rules.events.on_checkpoint_passed += self.handle_checkpoint_passed
+        self.race.race_rules.events.on_lap_completed += self.handle_lap_completed
+        self.race.race_rules.events.on_race_finished += self.handle_race_finished
+
+    def stop(self):
+        """Write the lap table, put the tick and lap counts in the header and close the file.
+        The on_trace_recorded handlers receive the file path afterwards."""
+        if self.file is None:
+            return
+
+        TraceFile.write_laps(self.file, self.laps)
+        TraceFile.write_header(
+            self.file, 1.0 / Settings.TICK_RATE, self.tick, len(self.laps), self.car_option, self.car.name
+        )
+        self.file.close()
+        self.file = None
+        self.events.on_trace_recorded.notify(self.file_path)
+
+    # ------------------------------
+    # Event handlers
+    # ------------------------------
+    def handle_stage_completed(self, stage, seconds):
+        """Handle the race stage completed event, the car is sampled after the last stage of a tick."""
+        if stage != self.race.pipeline[-1][0] or self.file is None:
+            return
+
+        x, y = self.car.position.get_pos()
+        TraceFile.write_sample(self.file, x, y, self.car.statistics.current.rotation)
+        self.tick += 1
+
+        if self.finished:
+            self.stop()
+
+    def handle_checkpoint_passed(self, car, checkpoint):
+        """Handle the checkpoint passed event, passing the first checkpoint starts a lap on the current tick."""
+        if car is self.car and checkpoint == 0:
+            self.lap_started = self.tick
+
+    def handle_lap_completed(self, car, lap, lap_time):
+        """Handle the lap completed event, the lap ends on the current tick."""
+        if car is self.car and self.lap_started is not None:
+            self.laps.append((self.lap_started, self.tick, lap_time))
+
+    def handle_race_finished(self, car):
+        """Handle the race finished event, the recording stops after the tick the car finished on."""
+        if car is self.car:
+            self.finished = True
@@ -0,0 +1,122 @@
+"""Run races without a display as fast as possible, run from the project root: python headless.py [map_name] [laps]
+A replay file is raced again instead: python headless.py replays/<replay>.rrep"""
+import os
+
+# Must be set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import sys
+from pathlib import Path
+from core.dependency_injection import DI
+from core.input_state import InputState
+from core.replay_file import ReplayFile
+from core.replay_input import ReplayInput
+from core.services.scene_service import SceneService
+from scenes.race_scene import RaceScene
+from settings import Settings
+
+
+def create_race(
+    map_name: str,
+    car_options: list[tuple] = None,
+    laps: int = Settings.RACE_LAPS,
+    seed: int = None,
+) -> RaceScene:
+    """Create a race driven by AI players only, one for every car option, the seed picks the cars that fill up the race.
+    Without a seed the race is seeded randomly."""
+    scene_service = DI.getInstance().get(SceneService)
+    race = RaceScene(scene_service.screen, scene_service.services)
+    race.map_name = map_name
+    race.laps = laps
+    race.ai_drivers = True
+    if seed is not None:
+        race.set_seed(seed)
+
+    for index, car_option in enumerate(car_options or []):
+        race.add_player(race.create_ai_player(index, car_option))
+
+    race.preload()
+    return race
+
+
+def run_race(
+    map_name: str = "map_right",
+    car_options: list[tuple] = None,
+    laps: int = Settings.RACE_LAPS,
+    timedelta: float = 1.0 / Settings.TICK_RATE,
+    max_race_time: float = Settings.HEADLESS_MAX_RACE_TIME,
+    seed: int = None,
+) -> dict:
+    """Run a race with a fixed timedelta until every car finished or the race time ran out, returns the result.
+    Ticks run back to back, the countdown and drawing of the race scene are skipped."""
+    race = create_race(map_name, car_options, laps, seed)
+    input_state = InputState()
+
+    ticks = 0
+    while race.race_rules.elapsed < max_race_time and not all(
+        race.race_rules.get_progress(player).finished for player in race.players
+    ):
+        race.step(timedelta, input_state)
+        ticks += 1
+
+    return get_result(race, timedelta, ticks)
+
+
+def create_replay(file_path: Path) -> tuple[RaceScene, ReplayInput]:
+    """Create the race of a replay, the recorded players are driven by the replay and the rest by AI players."""
+    replay_input = ReplayInput(file_path)
+    header = replay_input.header
+
+    scene_service = DI.getInstance().get(SceneService)
+    race = RaceScene(scene_service.screen, scene_service.services)
+    race.map_name = header.map_name
+    race.laps = header.laps
+    race.ai_drivers = header.ai_drivers
+    race.set_seed(header.seed)
+    race.events.on_stage_completed += replay_input.handle_stage_completed
+
+    for index, (car_option, name) in enumerate(header.players):
+        race.add_player(race.create_replay_player(name, car_option, replay_input, index))
+
+    race.preload()
+    return (race, replay_input)
+
+
+def run_replay(file_path: Path) -> dict:
+    """Race a replay again up to the tick it was recorded to, returns the result like run_race."""
+    race, replay_input = create_replay(file_path)
+    input_state = InputState()
+
+    ticks = 0
+    while not replay_input.is_finished():
+        race.step(replay_input.header.timedelta, input_state)
+        ticks += 1
+
+    return get_result(race, replay_input.header.timedelta, ticks)
+
+
+def get_result(race: RaceScene, timedelta: float, ticks: int) -> dict:
+    """Get the result of a race after the given ticks."""
+    results = race.race_rules.get_results(race.players)
+    return {
+        "map": race.map_name,
+        "laps": race.laps,
+        "seed": race.seed,
+        "timedelta": timedelta,
+        "ticks": ticks,
+        "race_time": race.race_rules.elapsed,
+        "finished": all(result["finished"] for result in results),
+        "cars": results,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1].endswith(ReplayFile.EXTENSION):
+        print(json.dumps(run_replay(Path(sys.argv[1])), indent=2))
+        sys.exit()
+
+    map_name = sys.argv[1] if len(sys.argv) > 1 else "map_right"
+    laps = int(sys.argv[2]) if len(sys.argv) > 2 else Settings.RACE_LAPS
+    print(json.dumps(run_race(map_name, list(Settings.CAR_OPTIONS), laps), indent=2))
@@ -44,6 +44,7 @@ class MainScene(SceneBase):
             Alignment.CENTER,
             50,
             parent=self,
+            font_service=self.services.font,
         )
 
         singleplayer_button = ButtonComponent(
@@ -55,6 +56,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         singleplayer_button.align(Alignment.CENTER, singleplayer_button.scaled_size[0])
         singleplayer_button.events.on_button_clicked += self.singleplayer_start
@@ -68,6 +70,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         multiplayer_2p_button.events.on_button_clicked += self.multiplayer_2p_start
 
@@ -80,6 +83,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         multiplayer_3p_button.events.on_button_clicked += self.multiplayer_3p_start
         
@@ -92,6 +96,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         multiplayer_4p_button.events.on_button_clicked += self.multiplayer_4p_start
 
@@ -104,6 +109,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         highscores_button.events.on_button_clicked += self.show_highscores
 
@@ -116,6 +122,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         settings_button.events.on_button_clicked += self.show_settings
 
@@ -128,6 +135,7 @@ class MainScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         exit_button.events.on_button_clicked += self.exit_game
 
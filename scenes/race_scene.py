@@ -1,7 +1,12 @@
+import os
 import random
+import time
+from datetime import datetime
+from pathlib import Path
 from types import SimpleNamespace
 import pygame
-from core.car import Car
+from core.ai_car import AICar
+from core.camera import Camera
 from core.car_properties import CarProperties
 from core.components.button_component import ButtonComponent
 from core.components.countdown_component import CountdownComponent
@@ -11,9 +16,20 @@ from core.enums.alignment import Alignment
 from core.enums.log_level import LogLevel
 from core.enums.scene import Scene
 from core.enums.sprite_type import SpriteType
+from core.event_handler import EventHandler
+from core.ghost_car import GhostCar
+from core.input_recorder import InputRecorder
+from core.player_car import PlayerCar
 from core.position import Position
+from core.race_rules import RaceRules
 from core.relative import Relative
+from core.replay_car import ReplayCar
+from core.replay_file import ReplayFile
+from core.replay_input import ReplayInput
 from core.services.sprite_service import SpriteService
+from core.trace import Trace
+from core.trace_file import TraceFile
+from core.trace_recorder import TraceRecorder
 from scenes.scene_base import SceneBase
 from settings import Settings
 from utilities.helper import Helper
@@ -25,17 +41,44 @@ class RaceScene(SceneBase):
     def __init__(self, screen: pygame.surface, services: SimpleNamespace):
         super().__init__(screen, services)
         self.name = "race_scene"
+        self.map_name = "map_right"
+        self.laps = Settings.RACE_LAPS
+        self.ai_drivers = Settings.AI_DRIVERS
+        self.seed = None
+        self.random = random.Random()
+        self.set_seed(random.randrange(2**32))
+        self.recorder = None
+        self.ghosts = []
+        self.trace_recorder = None
         self.map = None
+        self.views = []
         self.players = []
 
         self.announcements = None
         self.started = False
+        self.race_rules = None
+        self.events.on_stage_completed = EventHandler()
+
+        # The race tick, every stage runs once per tick in this order
+        self.pipeline = [
+            ("input", self.step_input),
+            ("controls", self.step_controls),
+            ("physics", self.step_physics),
+            ("collision", self.step_collision),
+            ("race_rules", self.step_race_rules),
+        ]
+
+        # The AI players pick from the car options
+        self.warmup_sprites = [
+            (SpriteType.VEHICLE, sprite) for _, sprite, _ in Settings.CAR_OPTIONS
+        ]
 
         self.build_ui()
 
     def preload(self):
         if self.map is None:
-            self.map = self.services.map.get_map("map_right")
+            self.map = self.services.map.get_map(self.map_name)
+            self.race_rules = RaceRules(self.map, self.laps)
 
             if len(self.players) < Settings.MAX_PLAYERS:
                 self.services.logger.log(
@@ -55,6 +98,17 @@ class RaceScene(SceneBase):
                 self.players[index].set_position(Position(position))
                 self.players[index].set_rotation(direction.value * 90)
 
+            if self.ai_drivers:
+                for player in self.players:
+                    if isinstance(player, AICar):
+                        player.follow_route(self.race_rules)
+
+            if Settings.GHOSTS:
+                self.load_ghost()
+
+            self.create_views()
+            self.announcements.position = Position(self.get_announcement_position())
+
     def handle_event(self, event):
         super().handle_event(event)
 
@@ -76,22 +130,144 @@ class RaceScene(SceneBase):
         super().update(timedelta, input_state)
 
         if self.started:
-            for player in self.players:
-                player.update(timedelta, input_state)
-                self.services.collision.update(timedelta, input_state, self.map, self.players)
+            self.step(timedelta, input_state)
+
+    def step(self, timedelta, input_state):
+        """Advance the race by one tick, every stage of the pipeline runs once for all players.
+        The time each stage took is sent to the on_stage_completed handlers."""
+        for player in self.players:
+            player.save_state()
+
+        # Ghosts play back their trace, they are not simulated
+        for ghost in self.ghosts:
+            ghost.advance()
+
+        for name, stage in self.pipeline:
+            start = time.perf_counter()
+            stage(timedelta, input_state)
+            self.events.on_stage_completed.notify(name, time.perf_counter() - start)
+
+    def step_input(self, timedelta, input_state):
+        """Read the directions every player steers in."""
+        for player in self.players:
+            player.read_input(input_state)
+
+    def step_controls(self, timedelta, input_state):
+        """Apply the controls, changing the speed and rotation of every player."""
+        for player in self.players:
+            player.apply_controls()
+
+    def step_physics(self, timedelta, input_state):
+        """Move every player by its speed."""
+        for player in self.players:
+            player.integrate(timedelta)
+
+    def step_collision(self, timedelta, input_state):
+        """Detect the collisions of all players in one pass, then let every player resolve its own."""
+        collisions = self.services.collision.detect(self.map, self.players)
+        for player, collided in collisions.items():
+            player.resolve_collisions(collided)
+
+    def step_race_rules(self, timedelta, input_state):
+        """Update the checkpoints, laps and places."""
+        self.race_rules.update(self.players, timedelta)
 
     def draw(self, screen, opacity: int = 255):
         if self.map is not None:
-            self.map.draw(screen, opacity)
+            self.follow_players()
+            for camera, _ in self.views:
+                self.draw_view(screen, opacity, camera)
 
-            for player in self.players:
-                player.draw(screen, opacity)
+        super().draw(screen, opacity)
+
+    def draw_view(self, screen, opacity: int, camera: Camera):
+        """Draw the map and the cars seen by a camera, clipped to its viewport.
+        The views share the map's rendered chunks, every view only draws the chunks and cars it can see."""
+        previous_clip = screen.get_clip()
+        screen.set_clip(camera.viewport.clip(previous_clip))
+
+        self.map.draw(screen, opacity, camera)
+
+        # Cars outside the view are not drawn
+        screen_offset = camera.get_offset()
+        interpolation = self.services.scene.interpolation
+        for player in self.ghosts + self.players:
+            if camera.is_visible(player.get_rect()):
+                player.draw(screen, opacity, screen_offset, interpolation)
 
         Helper.draw_outline(
-            screen, (64, 64), (14 * 128, 7 * 128), (255, 255, 255), 2, opacity
+            screen,
+            camera.world_to_screen((Settings.MAP_OFFSET, Settings.MAP_OFFSET)),
+            self.map.get_size(),
+            (255, 255, 255),
+            2,
+            opacity,
         )
 
-        super().draw(screen, opacity)
+        if len(self.views) > 1:
+            pygame.draw.rect(screen, (255, 255, 255), camera.viewport, 2)
+
+        screen.set_clip(previous_clip)
+
+    def follow_players(self):
+        """Move the cameras to the players they follow, at the position the players are drawn at."""
+        for camera, player in self.views:
+            camera.follow(player.get_render_position(self.services.scene.interpolation))
+
+    def create_views(self):
+        """Create the cameras, split-screen gives every local player a view, otherwise the first player is followed."""
+        followed_players = [self.players[0]]
+        if Settings.SPLIT_SCREEN:
+            local_players = [
+                player for player in self.players if isinstance(player, PlayerCar)
+            ]
+            if len(local_players) > 1:
+                followed_players = local_players
+
+        viewports = Helper.get_split_viewports(
+            self.screen.get_rect(), len(followed_players)
+        )
+        self.views = []
+        for viewport, player in zip(viewports, followed_players):
+            camera = Camera(viewport, self.map.get_world_rect())
+            camera.follow(player.position)
+            self.views.append((camera, player))
+
+    def get_announcement_position(self):
+        """Get the center of the visible map for a single view, split-screen views are centered around the screen."""
+        viewports = [camera.viewport for camera, _ in self.views]
+        if len(viewports) > 1:
+            return viewports[0].unionall(viewports[1:]).center
+
+        camera, _ = self.views[0]
+        map_rect = pygame.Rect(
+            camera.world_to_screen((Settings.MAP_OFFSET, Settings.MAP_OFFSET)),
+            self.map.get_size(),
+        )
+        return map_rect.clip(camera.viewport).center
+
+    def get_dirty_rects(self):
+        """Return the changed rects of the components, the map and the players."""
+        dirty_rects = super().get_dirty_rects()
+        if dirty_rects is None:
+            return None
+
+        if self.map is not None:
+            self.follow_players()
+
+            # Split-screen views follow moving cars, so every viewport is redrawn
+            if len(self.views) > 1:
+                return dirty_rects + [camera.viewport for camera, _ in self.views]
+
+            camera, _ = self.views[0]
+            dirty_rects += self.map.get_dirty_rects(camera)
+
+            screen_offset = camera.get_offset()
+            interpolation = self.services.scene.interpolation
+            for player in self.ghosts + self.players:
+                dirty_rects += player.get_dirty_rects(screen_offset, interpolation)
+
+        return dirty_rects
 
     def build_ui(self):
         """Build the UI for the scene."""
@@ -103,17 +279,13 @@ class RaceScene(SceneBase):
             Alignment.CENTER,
             50,
             parent=self,
+            font_service=self.services.font,
         )
         self.components.append(race_label)
 
         announcement_label = CountdownComponent(
             "announcement_label",
-            Position(
-                (
-                    self.screen.get_width() / 2,
-                    Settings.MAP_OFFSET + (7 * Settings.TILE_SIZE) / 2,
-                )
-            ),
+            Position(self.screen.get_rect().center),
             [
                 ("Press [ENTER] to begin countdown!", -1),
                 ("3", 1),
@@ -124,6 +296,7 @@ class RaceScene(SceneBase):
             Alignment.CENTER,
             50,
             parent=self,
+            font_service=self.services.font,
         )
         self.components.append(announcement_label)
         self.announcements = announcement_label
@@ -141,6 +314,7 @@ class RaceScene(SceneBase):
                 Relative(initial_position, (index * 464, 0)),
                 None,
                 self,
+                self.services.font,
             )
             self.components.append(statistics_panel)
 
@@ -148,22 +322,130 @@ class RaceScene(SceneBase):
         """Add a player to the scene."""
         self.players.append(player)
 
-    def create_ai_player(self, index: int):
-        """Create an AI player."""
-        ai_car_options = self.get_ai_car_options(index)
-        return random.choice(ai_car_options)
+    def create_ai_player(self, index: int, car_option: tuple = None):
+        """Create an AI player, a random car option is chosen when none is given. Only the chosen car option is built."""
+        color, sprite, properties = car_option or self.random.choice(
+            Settings.CAR_OPTIONS
+        )
+        return AICar(
+            f"{color} C-{index}",
+            self.services.sprite.get_sprite_from(SpriteType.VEHICLE, sprite),
+            Position((0, 0)),
+            CarProperties(*properties),
+            self.services.font,
+        )
+
+    def create_replay_player(
+        self, name: str, car_option: int, replay_input: ReplayInput, player: int
+    ):
+        """Create a player driven by the input of a recorded player."""
+        color, sprite, properties = Settings.CAR_OPTIONS[car_option]
+        return ReplayCar(
+            name,
+            self.services.sprite.get_sprite_from(SpriteType.VEHICLE, sprite),
+            Position((0, 0)),
+            CarProperties(*properties),
+            replay_input,
+            player,
+            self.services.font,
+        )
+
+    def get_car_option(self, car) -> int:
+        """Get the index of the car option a car was built from."""
+        for index, (_, sprite, _) in enumerate(Settings.CAR_OPTIONS):
+            if sprite == car.sprite.name:
+                return index
+        raise ValueError(f"{car.name} is not built from a car option")
+
+    def get_local_player(self) -> PlayerCar | None:
+        """Get the first local player, None when every player is driven by the computer."""
+        return next(
+            (player for player in self.players if isinstance(player, PlayerCar)), None
+        )
+
+    def get_ghost_path(self) -> Path:
+        """Get the path of the trace the ghost of the map is played from."""
+        return Path(__file__).parents[1] / "ghosts" / f"{self.map_name}{TraceFile.EXTENSION}"
+
+    def load_ghost(self):
+        """Create a ghost of the best lap in the trace of the map, when there is one.
+        The ghost starts its lap together with the local player."""
+        ghost_path = self.get_ghost_path()
+        if not ghost_path.exists():
+            return
 
-    def get_ai_car_options(self, index: int):
-        """Get the car options for the ai car"""
-        return [
-            Car(
-                f"{color} C-{index}",
+        trace = Trace(ghost_path)
+        lap = trace.get_best_lap()
+        if lap is None:
+            trace.close()
+            return
+
+        color, sprite, properties = Settings.CAR_OPTIONS[trace.header.car_option]
+        self.ghosts.append(
+            GhostCar(
+                f"{trace.header.name} ({lap[2]:.2f}s)",
                 self.services.sprite.get_sprite_from(SpriteType.VEHICLE, sprite),
-                Position((0, 0)),
                 CarProperties(*properties),
+                trace,
+                lap,
+                self.services.font,
             )
-            for color, sprite, properties in Settings.CAR_OPTIONS
-        ]
+        )
+        self.race_rules.events.on_checkpoint_passed += self.handle_checkpoint_passed
+
+    def set_seed(self, seed: int):
+        """Seed the random choices of the race, the same seed and input always give the same race."""
+        self.seed = seed
+        self.random.seed(seed)
 
     def start_race(self, sender: CountdownComponent):
         self.started = True
+
+        if Settings.RECORD_REPLAYS:
+            file_name = f"{self.map_name}_{datetime.now():%Y%m%d_%H%M%S}{ReplayFile.EXTENSION}"
+            self.recorder = InputRecorder(
+                Path(__file__).parents[1] / "replays" / file_name, self
+            )
+            self.recorder.start()
+
+        local_player = self.get_local_player()
+        if Settings.GHOSTS and local_player is not None:
+            ghost_path = self.get_ghost_path()
+            self.trace_recorder = TraceRecorder(
+                ghost_path.with_name(f"{ghost_path.stem}_recording{TraceFile.EXTENSION}"),
+                self,
+                local_player,
+                self.get_car_option(local_player),
+            )
+            self.trace_recorder.events.on_trace_recorded += self.handle_trace_recorded
+            self.trace_recorder.start()
+
+    # ------------------------------
+    # Event handlers
+    # ------------------------------
+    def handle_checkpoint_passed(self, car, checkpoint):
+        """Handle the checkpoint passed event, the ghosts start their lap when the local player starts one."""
+        if checkpoint == 0 and car is self.get_local_player():
+            for ghost in self.ghosts:
+                ghost.start_lap()
+
+    def handle_trace_recorded(self, file_path: Path):
+        """Handle the trace recorded event, the trace replaces the ghost of the map when it has a faster lap."""
+        trace = Trace(file_path)
+        lap = trace.get_best_lap()
+        trace.close()
+
+        best_lap_time = min((ghost.lap_time for ghost in self.ghosts), default=None)
+        if lap is None or (best_lap_time is not None and lap[2] >= best_lap_time):
+            os.remove(file_path)
+            return
+
+        # The ghosts are done, their traces are unmapped before the file is replaced
+        for ghost in self.ghosts:
+            ghost.trace.close()
+        self.ghosts = []
+
+        os.replace(file_path, self.get_ghost_path())
+        self.services.logger.log(
+            f"Saved [Ghost]: {self.map_name}, best lap {lap[2]:.2f}s", LogLevel.INFO
+        )
@@ -14,6 +14,9 @@ class SceneBase:
         self.screen = screen
         self.components = []
 
+        # Library sprites created before the scene is shown, as (SpriteType, name or id)
+        self.warmup_sprites = []
+
         # services
         self.services = services
 
@@ -39,6 +42,16 @@ class SceneBase:
         for component in self.components:
             component.draw(screen, opacity)
 
+    def get_dirty_rects(self):
+        """Return the screen rects that changed since the last call, None when unknown and the screen should be redrawn."""
+        dirty_rects = []
+        for component in self.components:
+            component_rects = component.get_dirty_rects()
+            if component_rects is None:
+                return None
+            dirty_rects += component_rects
+        return dirty_rects
+
     def preload(self):
         """Preload event triggered after the scene is started transitioning in."""
         pass
@@ -33,6 +33,11 @@ class SelectionScene(SceneBase):
         # Notify that the scene is initialized
         self.events.on_scene_initialized.notify()
 
+    def preload(self):
+        """Prefetch the race map while the players choose their cars."""
+        race = self.services.scene.get_scene(Scene.RACESCENE)
+        self.services.map.prefetch_map(race.map_name)
+
     def handle_event(self, event):
         super().handle_event(event)
 
@@ -52,6 +57,7 @@ class SelectionScene(SceneBase):
             Alignment.CENTER,
             50,
             parent=self,
+            font_service=self.services.font,
         )
 
         segment_positions = Helper.get_middle_positions(
@@ -64,6 +70,7 @@ class SelectionScene(SceneBase):
                 self.get_car_options(),
                 Position((segment_positions[i], 260)),
                 self.services.sprite,
+                self.services.font,
                 parent=self,
             )
             player_car_selection.align(
@@ -82,6 +89,7 @@ class SelectionScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         back_button.align(Alignment.RIGHT, back_button.scaled_size[0])
         back_button.events.on_button_clicked += self.back
@@ -95,6 +103,7 @@ class SelectionScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         start_race_button.align(Alignment.LEFT, start_race_button.scaled_size[0])
         start_race_button.events.on_button_clicked += self.start_race
@@ -177,6 +186,7 @@ class SelectionScene(SceneBase):
                 None,
                 Position((0, 0)),
                 CarProperties(*properties),
+                self.services.font,
             )
             for color, sprite, properties in Settings.CAR_OPTIONS
         ]
\ No newline at end of file
@@ -42,6 +42,7 @@ class SettingsScene(SceneBase):
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button00.png"),
             self.services.sprite.get_sprite_from(SpriteType.UI, "green_button01.png"),
             parent=self,
+            font_service=self.services.font,
         )
         back_button.align(Alignment.RIGHT, back_button.scaled_size[0])
         back_button.events.on_button_clicked += self.back
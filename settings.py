@@ -1,4 +1,5 @@
 from types import SimpleNamespace
+import pygame
 from core.enums.sprite_type import SpriteType
 from core.enums.log_level import LogLevel
 
@@ -9,10 +10,31 @@ class Settings:
     BASE_RESOLUTION = (1920, 1080)
     MAP_OFFSET = 64
     TILE_SIZE = 128
+    MAP_CHUNK_SIZE = 8  # tiles along each side of a cached map chunk
     MAX_PLAYERS = 4
     TRANSITION_SPEED = 1  # speed in seconds
     PLAYER_TO_PLAYER_COLLISION = False
+    # World pixels moved every second for each unit of car speed. Races used to move every car once per player
+    # each tick, and races are filled up to MAX_PLAYERS, so cars moved 4 times their speed with MAX_PLAYERS = 4.
+    # The scale keeps that pace as a fixed tuning of the car properties, it no longer follows MAX_PLAYERS.
+    SPEED_SCALE = 4
+    AI_DRIVERS = False  # AI cars filling up a race drive it, otherwise they stay at the start
+    AI_BRAKING_ANGLE = 45  # degrees off course at which AI cars brake instead of accelerate
+    RACE_LAPS = 3
+    RECORD_REPLAYS = False  # record the input of every race to the replays folder
+    GHOSTS = False  # race against a ghost of the best lap on the map, recorded from the local player
+    GHOST_OPACITY = 100  # opacity of ghost cars
+    HEADLESS_MAX_RACE_TIME = 600  # seconds of race time after which a headless race is stopped unfinished
     DRAW_MASKS = False
+    SPLIT_SCREEN = False  # give every local player their own view in races with 2 to 4 players
+    DIRTY_RECTS = False  # only redraw and present the regions that changed
+    OPACITY_BUCKET_SIZE = 16  # opacity steps while fading cached surfaces
+    TEXT_RENDER_CACHE_BUDGET = 4 * 1024 * 1024  # bytes of rendered text kept
+    SPRITESHEET_SUBSURFACES = True  # slice sprites as views sharing the sheet's pixels
+    LAZY_SPRITE_LIBRARY = True  # create library sprites on first use
+    SPRITESHEET_DECODE_WORKERS = 4  # threads decoding spritesheets at startup and when compiling the asset cache, 0 decodes on first use
+    ASSET_CACHE = True  # load spritesheets from assets/.cache, compiled when missing or stale
+    ROTATION_ATLAS_STEPS = 60  # pre-rendered vehicle rotations, 6 degrees apart
     SCALE = {
         SpriteType.GLOBAL: 1.0,
         SpriteType.OBJECT: 0.75,
@@ -28,7 +50,12 @@ class Settings:
         ("Blue", "car_blue_small_1.png", (80, 2, 6, 1, 20, 6)),
     ]
     LOG_LEVEL = LogLevel.DEBUG
-    FPS = 30
+    FPS = 60  # rendered frames per second at most
+    TICK_RATE = 30  # simulation ticks per second, car handling is tuned per tick
+    MAX_CATCH_UP_TICKS = 5  # ticks run in one frame at most, the rest is dropped under load
+    PROFILER_SAMPLES = 300  # frames kept per profiled stage for the percentiles
+    PROFILER_REFRESH = 0.25  # seconds between refreshes of the profiler overlay
+    PROFILER_KEY = pygame.K_F3  # shows or hides the stage times of the profiler overlay
 
     def __init__(self) -> None:
         self.resolution = (1920, 1080)
@@ -0,0 +1,24 @@
+"""Compile the spritesheets into the asset cache, run from the project root: python -m utilities.compile_assets"""
+import sys
+from pathlib import Path
+from core.services.sprite_service import SpriteService
+from core.sprites.asset_cache import AssetCache
+from core.sprites.spritesheet_repository import SpritesheetRepository
+
+
+def compile_assets(force: bool = False):
+    """Compile every spritesheet, by default only the ones that are missing or stale."""
+    root_path = Path(__file__).parents[1] / "assets"
+    asset_cache = AssetCache(root_path / ".cache")
+    asset_cache.events.on_log_message += lambda message, _: print(message)
+
+    repository = SpritesheetRepository(
+        root_path / "sprites", SpriteService.SPRITESHEETS, asset_cache
+    )
+    for spritesheet in repository.get_all_spritesheets():
+        if force or not asset_cache.is_valid(spritesheet):
+            asset_cache.compile(spritesheet)
+
+
+if __name__ == "__main__":
+    compile_assets("--force" in sys.argv)
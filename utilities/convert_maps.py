@@ -0,0 +1,18 @@
+"""Convert the JSON maps to binary map files, run from the project root: python -m utilities.convert_maps"""
+import os
+from pathlib import Path
+from core.map_file import MapFile
+from settings import Settings
+
+
+def convert_maps():
+    """Convert every JSON map in the maps folder to a binary map file next to it."""
+    maps_root = Path(__file__).parents[1] / "assets" / "maps"
+    for map_file in sorted(os.listdir(maps_root)):
+        if map_file.endswith(".json"):
+            file_path = MapFile.convert_json(maps_root / map_file, Settings.TILE_SIZE)
+            print(f"Converted [Map]: {map_file} -> {file_path.name}")
+
+
+if __name__ == "__main__":
+    convert_maps()
@@ -1,4 +1,5 @@
 import pygame
+from settings import Settings
 
 
 class Helper:
@@ -14,6 +15,37 @@ class Helper:
             middle_positions.append(middle_position)
         return middle_positions
 
+    @staticmethod
+    def get_split_viewports(rect: pygame.Rect, count: int) -> list[pygame.Rect]:
+        """Split a rect in viewports, side by side for two, a two by two grid for three or four."""
+        if count <= 1:
+            return [pygame.Rect(rect)]
+
+        columns, rows = (2, 1) if count == 2 else (2, 2)
+        width, height = rect.width // columns, rect.height // rows
+        return [
+            pygame.Rect(
+                rect.x + (index % columns) * width,
+                rect.y + (index // columns) * height,
+                width,
+                height,
+            )
+            for index in range(count)
+        ]
+
+    @staticmethod
+    def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Merge overlapping rects until none of them overlap, rects apart from each other stay separate."""
+        merged = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
     @staticmethod
     def draw_outline(
         screen: pygame.surface,
@@ -23,10 +55,32 @@ class Helper:
         thickness,
         opacity: int = 255,
     ):
-        rect = pygame.Rect(
+        rect = Helper.get_outline_rect(position, scaled_size, thickness)
+
+        # Filled sides, an outlined rect clipped one pixel past a side gets an extra column along the clip edge
+        for side in (
+            (rect.left, rect.top, rect.width, thickness),
+            (rect.left, rect.bottom - thickness, rect.width, thickness),
+            (rect.left, rect.top, thickness, rect.height),
+            (rect.right - thickness, rect.top, thickness, rect.height),
+        ):
+            pygame.draw.rect(screen, color, side)
+
+    @staticmethod
+    def get_outline_rect(
+        position: tuple[int, int], scaled_size: tuple[int, int], thickness
+    ) -> pygame.Rect:
+        """Get the rect covered by an outline drawn with draw_outline."""
+        return pygame.Rect(
             position[0] - (thickness * 2),
             position[1] - (thickness * 2),
             scaled_size[0] + (thickness * 4),
             scaled_size[1] + (thickness * 4),
         )
-        pygame.draw.rect(screen, color, rect, thickness)
+
+    @staticmethod
+    def get_opacity_bucket(opacity: int) -> int:
+        """Round the opacity down to its bucket, so cached surfaces are shared between nearby opacities."""
+        if opacity >= 255:
+            return 255
+        return opacity - opacity % Settings.OPACITY_BUCKET_SIZE